@@ -4,7 +4,7 @@ Handles parsing and validation of user input commands.
 """
 
 import re
-from typing import Tuple
+from typing import Iterable, List, Tuple
 from model.position import Position
 from model.exceptions import InvalidPositionException, InvalidInputException
 
@@ -43,6 +43,9 @@ class CommandParser:
         re.IGNORECASE
     )
 
+    # Runs of whitespace collapsed during sanitization
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+
     @staticmethod
     def parse_move_command(input_str: str) -> Tuple[Position, Position]:
         """
@@ -97,6 +100,24 @@ class CommandParser:
         # Try numeric format (e.g., "0,0 1,0")
         return CommandParser._parse_numeric_format(sanitized)
 
+    @staticmethod
+    def parse_move_commands(commands: Iterable[str]) -> List[Tuple[Position, Position]]:
+        """
+        Parse a batch of move command strings.
+
+        Args:
+            commands: The command strings to parse, in order
+
+        Returns:
+            A list of (from_position, to_position) tuples, one per command
+
+        Raises:
+            InvalidInputException: If any command format is invalid
+            InvalidPositionException: If any position is out of bounds
+        """
+        parse = CommandParser.parse_move_command
+        return [parse(command) for command in commands]
+
     @staticmethod
     def _parse_numeric_format(input_str: str) -> Tuple[Position, Position]:
         """
@@ -243,7 +264,7 @@ class CommandParser:
         sanitized = input_str.strip()
 
         # Normalize multiple spaces to single space
-        sanitized = re.sub(r'\s+', ' ', sanitized)
+        sanitized = CommandParser.WHITESPACE_PATTERN.sub(' ', sanitized)
 
         return sanitized
 
@@ -4,20 +4,87 @@ Handles file operations for save/load and record functionality.
 """
 
 import json
+import mmap
+import os
+import re
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 from datetime import datetime
+from json import scanner as json_scanner
 
 from model.game import Game
 from model.position import Position
 from model.enums import PlayerColor, GameStatus
-from model.exceptions import FileOperationException, ValidationException
+from model.exceptions import (
+    JungleGameException,
+    FileOperationException,
+    FileOpError,
+    ValidationException
+)
 from utils.logger import get_logger
 
+# JSON backend, fastest first: orjson, then simplejson with its C speedups,
+# then the standard library. Both third-party packages are optional, and a
+# simplejson without _speedups is skipped in favour of the stdlib C scanner.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+simplejson = None
+if orjson is None:
+    try:
+        import simplejson
+        from simplejson import _speedups  # noqa: F401  (C extension present)
+    except ImportError:
+        simplejson = None
+
+# Whether the chosen backend has a C path
+if orjson is not None or simplejson is not None:
+    JSON_SPEEDUPS = True
+else:
+    JSON_SPEEDUPS = json_scanner.c_make_scanner is not None
+
+# Set REQUIRE_SPEEDUPS to fail loudly instead of silently running a
+# pure-Python JSON backend
+if os.environ.get('REQUIRE_SPEEDUPS') and not JSON_SPEEDUPS:
+    raise ImportError(
+        "REQUIRE_SPEEDUPS is set but the chosen JSON backend has no C speedups"
+    )
+
 # Initialize logger for this module
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _piece_class(piece_name: str):
+    """
+    Look up a concrete piece class by name.
+
+    Args:
+        piece_name: Class name of the piece (e.g., 'Rat')
+
+    Returns:
+        The piece class, or None if the name is not a piece type
+    """
+    from model.piece import (
+        Rat, Cat, Dog, Wolf, Leopard, Tiger, Lion, Elephant
+    )
+
+    piece_classes = {
+        'Rat': Rat,
+        'Cat': Cat,
+        'Dog': Dog,
+        'Wolf': Wolf,
+        'Leopard': Leopard,
+        'Tiger': Tiger,
+        'Lion': Lion,
+        'Elephant': Elephant
+    }
+    return piece_classes.get(piece_name)
+
+
 class FileManager:
     """
     Handles file operations for save/load and records.
@@ -26,9 +93,21 @@ class FileManager:
     and move history to .record files.
     """
 
-    JUNGLE_VERSION = "1.0"
+    JUNGLE_VERSION = "2.0"
+    LEGACY_JUNGLE_VERSION = "1.0"
     RECORD_VERSION = "1.0"
 
+    # Compact board encoding used since version 2.0: one code per square in
+    # row-major order, 0 for an empty square, rank (1-8) for Red pieces and
+    # rank + 8 (9-16) for Blue pieces
+    PIECE_TYPES_BY_RANK = (
+        'Rat', 'Cat', 'Dog', 'Wolf', 'Leopard', 'Tiger', 'Lion', 'Elephant'
+    )
+    COLOR_CODE_OFFSETS = {PlayerColor.RED: 0, PlayerColor.BLUE: 8}
+
+    # Color suffix after each name on a record's "Players:" line
+    PLAYER_COLOR_PATTERN = re.compile(r'\s*\([^)]*\)')
+
     @staticmethod
     def validate_filename(filename: str, expected_extension: str) -> Path:
         """
@@ -89,41 +168,18 @@ class FileManager:
                 filepath = filepath.with_suffix('.jungle')
                 logger.debug(f"Added .jungle extension: {filepath}")
 
-            # Build game state dictionary
-            game_data = {
-                'version': FileManager.JUNGLE_VERSION,
-                'players': [
-                    {
-                        'name': player.name,
-                        'color': player.color.value
-                    }
-                    for player in game.players
-                ],
-                'current_player': game.current_player_index,
-                'board_state': FileManager._serialize_board(game),
-                'move_history': [
-                    move.to_dict() for move in game.move_history
-                ],
-                'game_status': game.game_status.value
-            }
-            
-            logger.debug(f"Serialized game data: {len(game_data['move_history'])} moves, "
-                        f"{len(game_data['board_state'])} pieces")
-
-            # Write to file with backup
-            if filepath.exists():
-                backup_path = filepath.with_suffix('.jungle.bak')
-                filepath.rename(backup_path)
-                logger.debug(f"Created backup: {backup_path}")
-
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(game_data, f, indent=2)
-
-            # Remove backup if save successful
-            backup_path = filepath.with_suffix('.jungle.bak')
-            if backup_path.exists():
-                backup_path.unlink()
-                logger.debug("Removed backup file")
+            data = FileManager.serialize_game(game)
+
+            # Write to a temporary file, then atomically swap it into place
+            # so an existing save is never left half-written
+            temp_path = filepath.with_suffix('.jungle.tmp')
+            try:
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(temp_path, filepath)
+            except OSError:
+                temp_path.unlink(missing_ok=True)
+                raise
 
             logger.info(f"Game saved successfully to {filepath}")
             return True
@@ -135,32 +191,166 @@ class FileManager:
             ) from e
 
     @staticmethod
-    def _serialize_board(game: Game) -> Dict[str, Dict[str, Any]]:
+    def serialize_game(game: Game) -> bytes:
         """
-        Serialize the board state to a dictionary.
+        Serialize a game to the .jungle JSON format without touching disk.
 
         Args:
-            game: The game instance
+            game: The game instance to serialize
+
+        Returns:
+            The encoded .jungle document
+        """
+        # Build game state dictionary
+        game_data = {
+            'version': FileManager.JUNGLE_VERSION,
+            'players': [
+                {
+                    'name': player.name,
+                    'color': player.color.value
+                }
+                for player in game.players
+            ],
+            'current_player': game.current_player_index,
+            'board_state': FileManager._serialize_board(game),
+            'move_history': [
+                move.to_dict() for move in game.move_history
+            ],
+            'game_status': game.game_status.value
+        }
+
+        piece_count = sum(1 for code in game_data['board_state'] if code)
+        logger.debug(f"Serialized game data: {len(game_data['move_history'])} moves, "
+                    f"{piece_count} pieces")
+
+        return FileManager._encode_json(game_data)
+
+    @staticmethod
+    def deserialize_game(data: bytes) -> Game:
+        """
+        Restore a game from an encoded .jungle document without touching disk.
+
+        Args:
+            data: The encoded .jungle document (bytes or a bytes-like view)
+
+        Returns:
+            Game instance restored from the document
+
+        Raises:
+            FileOperationException: If the document is invalid
+        """
+        try:
+            return FileManager._game_from_data(FileManager._decode_json(data))
+        except json.JSONDecodeError as e:
+            raise FileOperationException(
+                f"Invalid JSON in game data: {str(e)}",
+                code=FileOpError.BAD_JSON
+            ) from e
+        except FileOperationException:
+            raise
+        except Exception as e:
+            raise FileOperationException(
+                f"Failed to load game data: {str(e)}"
+            ) from e
+
+    @staticmethod
+    def _encode_json(data: Dict[str, Any]) -> bytes:
+        """
+        Encode save data as indented UTF-8 JSON.
+
+        Uses orjson or simplejson when installed, otherwise the standard
+        json module.
+
+        Args:
+            data: The dictionary to encode
+
+        Returns:
+            The encoded JSON document
+        """
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        if simplejson is not None:
+            return simplejson.dumps(data, indent=2).encode('utf-8')
+        return json.dumps(data, indent=2).encode('utf-8')
+
+    @staticmethod
+    def _decode_json(raw) -> Dict[str, Any]:
+        """
+        Decode a UTF-8 JSON document.
+
+        Args:
+            raw: The encoded JSON document (bytes, or any bytes-like view
+                when orjson is the backend)
 
         Returns:
-            Dictionary mapping position strings to piece data
+            The decoded dictionary
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON
+                (orjson.JSONDecodeError is a subclass; simplejson errors
+                are converted)
         """
-        board_state = {}
+        if orjson is not None:
+            return orjson.loads(raw)
+        if simplejson is not None:
+            try:
+                return simplejson.loads(raw)
+            except simplejson.JSONDecodeError as e:
+                raise json.JSONDecodeError(e.msg, e.doc, e.pos) from e
+        return json.loads(raw)
 
-        for row in range(game.board.BOARD_HEIGHT):
-            for col in range(game.board.BOARD_WIDTH):
-                pos = Position(row, col)
-                piece = game.board.get_piece(pos)
+    @staticmethod
+    def _load_json_file(filepath: Path) -> Dict[str, Any]:
+        """
+        Read and decode a JSON file.
 
-                if piece is not None:
-                    pos_key = f"{row},{col}"
-                    board_state[pos_key] = {
-                        'piece': piece.__class__.__name__,
-                        'owner': piece.owner.color.value,
-                        'rank': piece.rank
-                    }
+        With orjson, non-empty files are memory-mapped so the decoder
+        reads the page cache directly instead of a copied buffer. The
+        other backends only accept bytes, so they read the file normally.
 
-        return board_state
+        Args:
+            filepath: Path to the JSON file
+
+        Returns:
+            The decoded dictionary
+
+        Raises:
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        with open(filepath, 'rb') as f:
+            # Only orjson parses a mapped buffer without copying it, and
+            # mmap rejects zero-length files
+            if orjson is None or os.fstat(f.fileno()).st_size == 0:
+                return FileManager._decode_json(f.read())
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return FileManager._decode_json(view)
+
+    @staticmethod
+    def _serialize_board(game: Game) -> List[int]:
+        """
+        Serialize the board state to a flat list of piece codes.
+
+        Args:
+            game: The game instance
+
+        Returns:
+            List of BOARD_HEIGHT * BOARD_WIDTH piece codes in row-major order
+        """
+        board = game.board
+        offsets = FileManager.COLOR_CODE_OFFSETS
+        codes = []
+
+        for row in range(board.BOARD_HEIGHT):
+            for col in range(board.BOARD_WIDTH):
+                piece = board.get_piece(Position(row, col))
+                if piece is None:
+                    codes.append(0)
+                else:
+                    codes.append(piece.rank + offsets[piece.owner.color])
+
+        return codes
 
     @staticmethod
     def load_game(filename: str) -> Optional[Game]:
@@ -180,55 +370,85 @@ class FileManager:
             filepath = Path(filename)
 
             if not filepath.exists():
-                raise FileOperationException(f"File not found: {filename}")
-
-            if filepath.suffix != '.jungle':
                 raise FileOperationException(
-                    f"Invalid file extension: expected .jungle, got {filepath.suffix}"
+                    f"File not found: {filename}", code=FileOpError.NOT_FOUND
                 )
 
-            with open(filepath, 'r', encoding='utf-8') as f:
-                game_data = json.load(f)
-
-            # Validate version
-            if game_data.get('version') != FileManager.JUNGLE_VERSION:
+            if filepath.suffix != '.jungle':
                 raise FileOperationException(
-                    f"Unsupported file version: {game_data.get('version')}"
+                    f"Invalid file extension: expected .jungle, got {filepath.suffix}",
+                    code=FileOpError.BAD_EXT
                 )
 
-            # Create game with player names
-            player_data = game_data['players']
-            game = Game(
-                player1_name=player_data[0]['name'],
-                player2_name=player_data[1]['name']
-            )
-
-            # Clear the board (we'll restore from saved state)
-            FileManager._clear_board(game)
-
-            # Restore board state
-            FileManager._deserialize_board(game, game_data['board_state'])
-
-            # Restore current player
-            game._current_player_index = game_data['current_player']
+            game_data = FileManager._load_json_file(filepath)
 
-            # Restore game status
-            game._game_status = GameStatus(game_data['game_status'])
-
-            # Note: We don't restore move_history or game_states for undo
-            # as those are for the current session only
-
-            return game
+            return FileManager._game_from_data(game_data)
 
         except json.JSONDecodeError as e:
             raise FileOperationException(
-                f"Invalid JSON in file {filename}: {str(e)}"
+                f"Invalid JSON in file {filename}: {str(e)}",
+                code=FileOpError.BAD_JSON
+            ) from e
+        except FileOperationException as e:
+            raise FileOperationException(
+                f"Failed to load game from {filename}: {str(e)}",
+                code=e.code
             ) from e
         except Exception as e:
             raise FileOperationException(
                 f"Failed to load game from {filename}: {str(e)}"
             ) from e
 
+    @staticmethod
+    def _game_from_data(game_data: Dict[str, Any]) -> Game:
+        """
+        Build a game from a decoded .jungle document.
+
+        Args:
+            game_data: The decoded .jungle document
+
+        Returns:
+            Game instance restored from the document
+
+        Raises:
+            FileOperationException: If the version or piece data is invalid
+        """
+        # Validate version
+        version = game_data.get('version')
+        if version not in (FileManager.JUNGLE_VERSION,
+                           FileManager.LEGACY_JUNGLE_VERSION):
+            raise FileOperationException(
+                f"Unsupported file version: {version}"
+            )
+
+        # Create game with player names
+        player_data = game_data['players']
+        game = Game(
+            player1_name=player_data[0]['name'],
+            player2_name=player_data[1]['name']
+        )
+
+        # Clear the board (we'll restore from saved state)
+        FileManager._clear_board(game)
+
+        # Restore board state
+        if version == FileManager.LEGACY_JUNGLE_VERSION:
+            FileManager._deserialize_legacy_board(game, game_data['board_state'])
+        else:
+            FileManager._deserialize_board(game, game_data['board_state'])
+
+        # Restore current player
+        game._current_player_index = game_data['current_player']
+
+        # Restore game status
+        game._game_status = GameStatus(game_data['game_status'])
+        game.rehash()
+
+        # Note: We don't restore move_history or undo moves
+        # as those are for the current session only
+
+        return game
+
     @staticmethod
     def _clear_board(game: Game) -> None:
         """
@@ -238,66 +458,76 @@ class FileManager:
             game: The game instance
         """
         # Clear board grid
-        for row in range(game.board.BOARD_HEIGHT):
-            for col in range(game.board.BOARD_WIDTH):
-                pos = Position(row, col)
-                game.board.set_piece(pos, None)
+        game.board.clear()
 
         # Clear player piece collections
         for player in game.players:
-            player._pieces.clear()
+            player.clear_pieces()
 
     @staticmethod
-    def _deserialize_board(game: Game, board_state: Dict[str, Dict[str, Any]]) -> None:
+    def _deserialize_board(game: Game, board_state: List[int]) -> None:
         """
-        Restore the board state from a dictionary.
+        Restore the board state from a flat list of piece codes.
 
         Args:
             game: The game instance
-            board_state: Dictionary mapping position strings to piece data
+            board_state: Piece codes in row-major order
 
         Raises:
-            FileOperationException: If piece data is invalid
+            FileOperationException: If the board data is invalid
         """
-        from model.piece import (
-            Rat, Cat, Dog, Wolf, Leopard, Tiger, Lion, Elephant
-        )
+        width = game.board.BOARD_WIDTH
+        expected_squares = game.board.BOARD_HEIGHT * width
+        if len(board_state) != expected_squares:
+            raise FileOperationException(
+                f"Invalid board state: expected {expected_squares} squares, "
+                f"got {len(board_state)}"
+            )
 
-        piece_classes = {
-            'Rat': Rat,
-            'Cat': Cat,
-            'Dog': Dog,
-            'Wolf': Wolf,
-            'Leopard': Leopard,
-            'Tiger': Tiger,
-            'Lion': Lion,
-            'Elephant': Elephant
-        }
+        blue_offset = FileManager.COLOR_CODE_OFFSETS[PlayerColor.BLUE]
+        max_code = blue_offset + len(FileManager.PIECE_TYPES_BY_RANK)
+
+        for index, code in enumerate(board_state):
+            # type() rather than isinstance(): JSON true/false are bools,
+            # which would otherwise pass as codes 1 and 0
+            if type(code) is not int or not 0 <= code <= max_code:
+                raise FileOperationException(f"Unknown piece code: {code}")
+
+            if code == 0:
+                continue
+
+            owner_color = PlayerColor.RED if code <= blue_offset else PlayerColor.BLUE
+            rank = code - FileManager.COLOR_CODE_OFFSETS[owner_color]
+            piece_name = FileManager.PIECE_TYPES_BY_RANK[rank - 1]
+
+            row, col = divmod(index, width)
+            pos = Position(row, col)
+            piece = FileManager._create_piece(game, piece_name, owner_color, pos)
+
+            # Positions come from the square index, so they are always valid
+            game.board.place_unchecked(pos, piece)
+            piece.owner.add_piece(piece)
+
+    @staticmethod
+    def _deserialize_legacy_board(game: Game, board_state: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Restore the board state from a version 1.0 dictionary.
+
+        Args:
+            game: The game instance
+            board_state: Dictionary mapping position strings to piece data
 
+        Raises:
+            FileOperationException: If piece data is invalid
+        """
         for pos_key, piece_data in board_state.items():
             # Parse position
             row, col = map(int, pos_key.split(','))
             pos = Position(row, col)
 
-            # Get piece class
             piece_name = piece_data['piece']
-            if piece_name not in piece_classes:
-                raise FileOperationException(f"Unknown piece type: {piece_name}")
-
-            # Get owner
             owner_color = PlayerColor(piece_data['owner'])
-            owner = None
-            for player in game.players:
-                if player.color == owner_color:
-                    owner = player
-                    break
-
-            if owner is None:
-                raise FileOperationException(f"Invalid owner color: {owner_color}")
-
-            # Create piece
-            piece_class = piece_classes[piece_name]
-            piece = piece_class(owner, pos)
+            piece = FileManager._create_piece(game, piece_name, owner_color, pos)
 
             # Validate rank
             if piece.rank != piece_data['rank']:
@@ -308,7 +538,42 @@ class FileManager:
 
             # Place piece on board and add to player
             game.board.set_piece(pos, piece)
-            owner.add_piece(piece)
+            piece.owner.add_piece(piece)
+
+    @staticmethod
+    def _create_piece(game: Game, piece_name: str, owner_color: PlayerColor,
+                      pos: Position):
+        """
+        Create a piece for a restored board.
+
+        Args:
+            game: The game instance whose players own the pieces
+            piece_name: Class name of the piece (e.g., 'Rat')
+            owner_color: Color of the owning player
+            pos: Position of the piece
+
+        Returns:
+            The new piece (not yet placed on the board)
+
+        Raises:
+            FileOperationException: If the piece type or owner is invalid
+        """
+        # Get piece class
+        piece_class = _piece_class(piece_name)
+        if piece_class is None:
+            raise FileOperationException(f"Unknown piece type: {piece_name}")
+
+        # Get owner
+        owner = None
+        for player in game.players:
+            if player.color == owner_color:
+                owner = player
+                break
+
+        if owner is None:
+            raise FileOperationException(f"Invalid owner color: {owner_color}")
+
+        return piece_class(owner, pos)
 
     @staticmethod
     def save_record(game: Game, filename: str) -> bool:
@@ -365,9 +630,8 @@ class FileManager:
             else:
                 lines.append("Game Result: In Progress")
 
-            # Write to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(lines))
+            # Write the whole record with a single buffered write
+            filepath.write_bytes('\n'.join(lines).encode('utf-8'))
 
             return True
 
@@ -394,11 +658,14 @@ class FileManager:
             filepath = Path(filename)
 
             if not filepath.exists():
-                raise FileOperationException(f"File not found: {filename}")
+                raise FileOperationException(
+                    f"File not found: {filename}", code=FileOpError.NOT_FOUND
+                )
 
             if filepath.suffix != '.record':
                 raise FileOperationException(
-                    f"Invalid file extension: expected .record, got {filepath.suffix}"
+                    f"Invalid file extension: expected .record, got {filepath.suffix}",
+                    code=FileOpError.BAD_EXT
                 )
 
             with open(filepath, 'r', encoding='utf-8') as f:
@@ -412,25 +679,7 @@ class FileManager:
             if not version_line.startswith("JUNGLE_GAME_RECORD_V"):
                 raise FileOperationException("Invalid record file format")
 
-            # Parse moves
-            moves = []
-            for line in lines:
-                line = line.strip()
-                if line.startswith("Move "):
-                    # Extract move number and move string
-                    parts = line.split(": ", 1)
-                    if len(parts) == 2:
-                        move_str = parts[1]
-                        try:
-                            from model.move import Move
-                            move_data = Move.parse_record_string(move_str)
-                            moves.append(move_data)
-                        except ValueError as e:
-                            raise FileOperationException(
-                                f"Invalid move format: {move_str}"
-                            ) from e
-
-            return moves
+            return FileManager._parse_record_moves(lines)
 
         except Exception as e:
             if isinstance(e, FileOperationException):
@@ -439,6 +688,39 @@ class FileManager:
                 f"Failed to load record from {filename}: {str(e)}"
             ) from e
 
+    @staticmethod
+    def _parse_record_moves(lines: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse the "Move N: ..." lines of a record file in a single pass.
+
+        Args:
+            lines: All lines of the record file
+
+        Returns:
+            List of move dictionaries in record order
+
+        Raises:
+            FileOperationException: If a move line is malformed
+        """
+        from model.move import Move
+
+        moves = []
+        for line in lines:
+            line = line.strip()
+            if line.startswith("Move "):
+                # Extract move number and move string
+                parts = line.split(": ", 1)
+                if len(parts) == 2:
+                    move_str = parts[1]
+                    try:
+                        moves.append(Move.parse_record_string(move_str))
+                    except ValueError as e:
+                        raise FileOperationException(
+                            f"Invalid move format: {move_str}"
+                        ) from e
+
+        return moves
+
     @staticmethod
     def replay_record(filename: str, player1_name: str = None,
                       player2_name: str = None) -> Optional[Game]:
@@ -462,7 +744,9 @@ class FileManager:
             filepath = Path(filename)
 
             if not filepath.exists():
-                raise FileOperationException(f"File not found: {filename}")
+                raise FileOperationException(
+                    f"File not found: {filename}", code=FileOpError.NOT_FOUND
+                )
 
             with open(filepath, 'r', encoding='utf-8') as f:
                 lines = f.readlines()
@@ -480,9 +764,9 @@ class FileManager:
 
                         if len(player_parts) == 2:
                             # Extract names (remove color in parentheses)
-                            import re
-                            name1 = re.sub(r'\s*\([^)]*\)', '', player_parts[0]).strip()
-                            name2 = re.sub(r'\s*\([^)]*\)', '', player_parts[1]).strip()
+                            color_pattern = FileManager.PLAYER_COLOR_PATTERN
+                            name1 = color_pattern.sub('', player_parts[0]).strip()
+                            name2 = color_pattern.sub('', player_parts[1]).strip()
 
                             if player1_name is None:
                                 player1_name = name1
@@ -496,43 +780,9 @@ class FileManager:
             if player2_name is None:
                 player2_name = "Player 2"
 
-            # Create new game
-            game = Game(player1_name, player2_name)
-
-            # Parse and replay moves
-            for line in lines:
-                line = line.strip()
-                if line.startswith("Move "):
-                    # Extract move string
-                    parts = line.split(": ", 1)
-                    if len(parts) == 2:
-                        move_str = parts[1]
-                        try:
-                            from model.move import Move
-                            move_data = Move.parse_record_string(move_str)
-
-                            # Execute the move
-                            from_pos = Position(
-                                move_data['from_row'],
-                                move_data['from_col']
-                            )
-                            to_pos = Position(
-                                move_data['to_row'],
-                                move_data['to_col']
-                            )
-
-                            result = game.make_move(from_pos, to_pos)
-                            if not result.success:
-                                raise FileOperationException(
-                                    f"Failed to replay move: {result.message}"
-                                )
-
-                        except ValueError as e:
-                            raise FileOperationException(
-                                f"Invalid move format: {move_str}"
-                            ) from e
-
-            return game
+            # Replay moves on a new game
+            moves = FileManager._parse_record_moves(lines)
+            return FileManager.replay_moves(moves, player1_name, player2_name)
 
         except Exception as e:
             if isinstance(e, FileOperationException):
@@ -540,3 +790,41 @@ class FileManager:
             raise FileOperationException(
                 f"Failed to replay record from {filename}: {str(e)}"
             ) from e
+
+    @staticmethod
+    def replay_moves(moves: List[Dict[str, Any]], player1_name: str = "Player 1",
+                     player2_name: str = "Player 2") -> Game:
+        """
+        Replay already-parsed moves on a new game.
+
+        Args:
+            moves: Move dictionaries as returned by load_record, each with
+                from_row, from_col, to_row and to_col
+            player1_name: Name for player 1 (Red)
+            player2_name: Name for player 2 (Blue)
+
+        Returns:
+            Game instance with all moves replayed
+
+        Raises:
+            FileOperationException: If a move cannot be replayed
+        """
+        game = Game(player1_name, player2_name)
+
+        for number, move_data in enumerate(moves, 1):
+            from_pos = Position(move_data['from_row'], move_data['from_col'])
+            to_pos = Position(move_data['to_row'], move_data['to_col'])
+
+            try:
+                result = game.make_move(from_pos, to_pos)
+            except JungleGameException as e:
+                raise FileOperationException(
+                    f"Failed to replay move {number}: {str(e)}"
+                ) from e
+
+            if not result.success:
+                raise FileOperationException(
+                    f"Failed to replay move {number}: {result.message}"
+                )
+
+        return game
@@ -55,6 +55,27 @@ class GameController:
         self.file_manager = FileManager()
         self.running = False
 
+        # Command keyword -> handler, built once instead of an if/elif chain
+        self._commands = {
+            keyword: handler
+            for keywords, handler in (
+                (('undo', 'u'), self._handle_undo_command),
+                (('quit', 'q', 'exit'), self._handle_quit_command),
+                (('help', 'h', '?'), self._handle_help_command),
+            )
+            for keyword in keywords
+        }
+        self._commands_with_args = {
+            keyword: handler
+            for keywords, handler in (
+                (('save', 's'), self._handle_save_command),
+                (('load', 'l'), self._handle_load_command),
+                (('record', 'rec'), self._handle_record_command),
+                (('replay', 'rep'), self._handle_replay_command),
+            )
+            for keyword in keywords
+        }
+
     def run_game_loop(self) -> None:
         """
         Run the main game loop.
@@ -131,28 +152,23 @@ class GameController:
         cmd = parts[0]
 
         try:
-            # Route to appropriate handler
-            if cmd in ['move', 'm'] or self.command_parser.validate_command_format(command):
+            # Moves are recognised first, by keyword or by format
+            if cmd in ('move', 'm') or self.command_parser.validate_command_format(command):
                 return self._handle_move_command(command)
-            elif cmd in ['undo', 'u']:
-                return self._handle_undo_command()
-            elif cmd in ['save', 's']:
-                return self._handle_save_command(parts)
-            elif cmd in ['load', 'l']:
-                return self._handle_load_command(parts)
-            elif cmd in ['record', 'rec']:
-                return self._handle_record_command(parts)
-            elif cmd in ['replay', 'rep']:
-                return self._handle_replay_command(parts)
-            elif cmd in ['quit', 'q', 'exit']:
-                return self._handle_quit_command()
-            elif cmd in ['help', 'h', '?']:
-                return self._handle_help_command()
-            else:
-                print(self.view.display_error(
-                    f"Unknown command: {cmd}. Type 'help' for available commands."
-                ))
-                return False
+
+            # Route other commands to their handler
+            handler = self._commands.get(cmd)
+            if handler is not None:
+                return handler()
+
+            handler = self._commands_with_args.get(cmd)
+            if handler is not None:
+                return handler(parts)
+
+            print(self.view.display_error(
+                f"Unknown command: {cmd}. Type 'help' for available commands."
+            ))
+            return False
 
         except JungleGameException as e:
             print(self.view.display_error(str(e)))
@@ -3,7 +3,7 @@ Board class for Jungle Game.
 Represents the 7x9 game board with terrain and piece management.
 """
 
-from typing import Optional, Dict, TYPE_CHECKING
+from typing import Optional, Dict, Iterable, List, Tuple, TYPE_CHECKING
 from model.position import Position
 from model.enums import TerrainType, PlayerColor
 
@@ -17,45 +17,51 @@ class Board:
     7x9 game board with terrain and piece management.
 
     Attributes:
-        grid: 2D list representing the board (9 rows x 7 columns)
+        grid: Flat row-major list of the 63 squares (index row * 7 + col)
         terrain_map: Mapping of positions to terrain types
     """
 
     BOARD_HEIGHT = 9
     BOARD_WIDTH = 7
 
+    # Terrain never changes, so every board shares one map built on first use
+    _shared_terrain_map: Optional[Dict[Position, TerrainType]] = None
+
     def __init__(self):
         """Initialize an empty board with terrain."""
-        # Create empty grid (9 rows x 7 columns)
-        self._grid: list[list[Optional['Piece']]] = [
-            [None for _ in range(self.BOARD_WIDTH)]
-            for _ in range(self.BOARD_HEIGHT)
-        ]
-
-        # Initialize terrain map
-        self._terrain_map: Dict[Position, TerrainType] = {}
-        self._initialize_terrain()
-    
-    def _initialize_terrain(self) -> None:
-        """Initialize the terrain map with dens, traps, and water."""
+        # Create empty grid (9 rows x 7 columns, flattened row-major)
+        self._grid: List[Optional['Piece']] = [None] * (self.BOARD_HEIGHT * self.BOARD_WIDTH)
+
+        # Reuse the terrain map, building it for the first board only
+        if Board._shared_terrain_map is None:
+            Board._shared_terrain_map = self._build_terrain_map()
+        self._terrain_map: Dict[Position, TerrainType] = Board._shared_terrain_map
+
+    @staticmethod
+    def _build_terrain_map() -> Dict[Position, TerrainType]:
+        """Build the terrain map with dens, traps, and water."""
+        terrain_map: Dict[Position, TerrainType] = {}
+
         # Water squares (river in the middle, rows 3-5, columns 1-2 and 4-5)
         for row in range(3, 6):
             for col in [1, 2, 4, 5]:
-                self._terrain_map[Position(row, col)] = TerrainType.WATER
+                terrain_map[Position(row, col)] = TerrainType.WATER
 
         # Red player (bottom) - den and traps
-        self._terrain_map[Position(8, 3)] = TerrainType.DEN  # Red den
-        self._terrain_map[Position(7, 2)] = TerrainType.TRAP  # Red trap left
-        self._terrain_map[Position(7, 4)] = TerrainType.TRAP  # Red trap right
-        self._terrain_map[Position(8, 2)] = TerrainType.TRAP  # Red trap bottom-left
-        self._terrain_map[Position(8, 4)] = TerrainType.TRAP  # Red trap bottom-right
+        terrain_map[Position(8, 3)] = TerrainType.DEN  # Red den
+        terrain_map[Position(7, 2)] = TerrainType.TRAP  # Red trap left
+        terrain_map[Position(7, 4)] = TerrainType.TRAP  # Red trap right
+        terrain_map[Position(8, 2)] = TerrainType.TRAP  # Red trap bottom-left
+        terrain_map[Position(8, 4)] = TerrainType.TRAP  # Red trap bottom-right
 
         # Blue player (top) - den and traps
-        self._terrain_map[Position(0, 3)] = TerrainType.DEN  # Blue den
-        self._terrain_map[Position(1, 2)] = TerrainType.TRAP  # Blue trap left
-        self._terrain_map[Position(1, 4)] = TerrainType.TRAP  # Blue trap right
-        self._terrain_map[Position(0, 2)] = TerrainType.TRAP  # Blue trap top-left
-        self._terrain_map[Position(0, 4)] = TerrainType.TRAP  # Blue trap top-right
+        terrain_map[Position(0, 3)] = TerrainType.DEN  # Blue den
+        terrain_map[Position(1, 2)] = TerrainType.TRAP  # Blue trap left
+        terrain_map[Position(1, 4)] = TerrainType.TRAP  # Blue trap right
+        terrain_map[Position(0, 2)] = TerrainType.TRAP  # Blue trap top-left
+        terrain_map[Position(0, 4)] = TerrainType.TRAP  # Blue trap top-right
+
+        return terrain_map
     
     def get_piece(self, pos: Position) -> Optional['Piece']:
         """
@@ -69,7 +75,7 @@ class Board:
         """
         if not self.is_valid_position(pos):
             return None
-        return self._grid[pos.row][pos.col]
+        return self._grid[pos._index]
 
     def set_piece(self, pos: Position, piece: Optional['Piece']) -> None:
         """
@@ -80,7 +86,61 @@ class Board:
             piece: The piece to place, or None to clear
         """
         if self.is_valid_position(pos):
-            self._grid[pos.row][pos.col] = piece
+            self._grid[pos._index] = piece
+
+    def place_unchecked(self, pos: Position, piece: 'Piece') -> None:
+        """
+        Place a piece without bounds checking and sync its position.
+
+        Only for trusted positions, such as the starting layout or a
+        board decoded from a save file.
+
+        Args:
+            pos: The position to place the piece at (must be valid)
+            piece: The piece to place
+        """
+        self._grid[pos._index] = piece
+        piece.position = pos
+
+    def snapshot_pieces(self) -> Dict[Position, 'Piece']:
+        """
+        Get every occupied square in one sweep over the grid.
+
+        Positions are only built for occupied squares.
+
+        Returns:
+            Dictionary mapping each occupied position to its piece
+        """
+        return {
+            Position(*divmod(index, self.BOARD_WIDTH)): piece
+            for index, piece in enumerate(self._grid)
+            if piece is not None
+        }
+
+    def is_empty(self) -> bool:
+        """
+        Check whether no square on the board holds a piece.
+
+        Returns:
+            True if every square is empty, False otherwise
+        """
+        return self._grid.count(None) == len(self._grid)
+
+    def clear(self) -> None:
+        """Remove every piece from the board in place."""
+        self._grid[:] = [None] * len(self._grid)
+
+    def reset_to_initial(self, layout: Iterable[Tuple[Position, 'Piece']]) -> None:
+        """
+        Clear the board in place and put each piece back on its home square.
+
+        Args:
+            layout: (position, piece) pairs describing the starting layout
+        """
+        self.clear()
+
+        for pos, piece in layout:
+            self.place_unchecked(pos, piece)
 
     def is_valid_position(self, pos: Position) -> bool:
         """
@@ -3,6 +3,9 @@ Exception classes for Jungle Game.
 Defines the exception hierarchy for game-related errors.
 """
 
+from enum import IntEnum
+from typing import Optional
+
 
 class JungleGameException(Exception):
     """Base exception for all game-related errors."""
@@ -24,9 +27,26 @@ class GameOverException(JungleGameException):
     pass
 
 
+class FileOpError(IntEnum):
+    """Machine-readable reasons for a FileOperationException."""
+    NOT_FOUND = 1
+    BAD_EXT = 2
+    BAD_JSON = 3
+
+
 class FileOperationException(JungleGameException):
     """Raised when file save/load operations fail."""
-    pass
+
+    def __init__(self, message: str = "", code: Optional[FileOpError] = None):
+        """
+        Initialize the exception.
+
+        Args:
+            message: Human-readable description of the failure
+            code: Optional FileOpError identifying the failure reason
+        """
+        super().__init__(message)
+        self.code = code
 
 
 class InvalidInputException(JungleGameException):
@@ -3,7 +3,9 @@ Game class for Jungle Game.
 Central game state manager and rule enforcer.
 """
 
-from typing import List, Optional
+import random
+from collections import deque
+from typing import Deque, List, Optional
 from datetime import datetime
 
 from model.board import Board
@@ -18,8 +20,40 @@ from model.exceptions import (
     InvalidMoveException,
     InvalidCaptureException
 )
-from model.game_state import GameState
 from model.move import Move, MoveResult
+from model.piece import Rat, Cat, Dog, Wolf, Leopard, Tiger, Lion, Elephant
+
+# Starting layout as (position, piece class, player index): Red (0) at the
+# bottom in rows 6-8, Blue (1) at the top in rows 0-2
+_STARTING_LAYOUT = (
+    # Red
+    (Position(6, 0), Lion, 0), (Position(6, 6), Tiger, 0),
+    (Position(7, 1), Dog, 0), (Position(7, 5), Cat, 0),
+    (Position(8, 0), Rat, 0), (Position(8, 2), Leopard, 0),
+    (Position(8, 4), Wolf, 0), (Position(8, 6), Elephant, 0),
+    # Blue
+    (Position(0, 0), Elephant, 1), (Position(0, 2), Wolf, 1),
+    (Position(0, 4), Leopard, 1), (Position(0, 6), Rat, 1),
+    (Position(1, 1), Cat, 1), (Position(1, 5), Dog, 1),
+    (Position(2, 0), Tiger, 1), (Position(2, 6), Lion, 1),
+)
+
+# Zobrist keys: one random 64-bit value per (piece code, square), where the
+# piece code is the rank, plus 8 for Blue. A fixed seed keeps position keys
+# stable between runs.
+_ZOBRIST_RNG = random.Random(0x4A554E474C45)
+_ZOBRIST_KEYS = tuple(
+    tuple(_ZOBRIST_RNG.getrandbits(64)
+          for _ in range(Board.BOARD_HEIGHT * Board.BOARD_WIDTH))
+    for _ in range(17)
+)
+_ZOBRIST_BLUE_TO_MOVE = _ZOBRIST_RNG.getrandbits(64)
+
+
+def _zobrist_key(piece, pos: Position) -> int:
+    """Get the Zobrist key for a piece standing on a square."""
+    code = piece.rank + (8 if piece.owner.color == PlayerColor.BLUE else 0)
+    return _ZOBRIST_KEYS[code][pos.row * Board.BOARD_WIDTH + pos.col]
 
 
 class Game:
@@ -34,7 +68,7 @@ class Game:
         players: List of players (2 players)
         current_player_index: Index of the current player (0 or 1)
         move_history: List of all moves made in the game
-        game_states: List of game states for undo functionality
+        undo_moves: The last MAX_UNDO_MOVES moves, reversed on undo
         game_status: Current status of the game
     """
 
@@ -55,56 +89,68 @@ class Game:
         ]
         self._current_player_index = 0  # Player 1 (Red) starts
         self._move_history: List[Move] = []
-        self._game_states: List[GameState] = []
+        self._undo_moves: Deque[Move] = deque(maxlen=self.MAX_UNDO_MOVES)
         self._game_status = GameStatus.ONGOING
 
         # Initialize pieces on the board
         self._initialize_pieces()
+        self.rehash()
 
     def _initialize_pieces(self) -> None:
         """Initialize all pieces in their starting positions."""
-        from model.piece import Rat, Cat, Dog, Wolf, Leopard, Tiger, Lion, Elephant
-
-        # Red player pieces (bottom, rows 6-8)
-        red_player = self._players[0]
-        red_pieces = [
-            # Row 6
-            Lion(red_player, Position(6, 0)),
-            Tiger(red_player, Position(6, 6)),
-            # Row 7
-            Dog(red_player, Position(7, 1)),
-            Cat(red_player, Position(7, 5)),
-            # Row 8
-            Rat(red_player, Position(8, 0)),
-            Leopard(red_player, Position(8, 2)),
-            Wolf(red_player, Position(8, 4)),
-            Elephant(red_player, Position(8, 6)),
-        ]
+        layout = []
+        for pos, piece_class, player_index in _STARTING_LAYOUT:
+            owner = self._players[player_index]
+            piece = piece_class(owner, pos)
+            self._board.place_unchecked(pos, piece)
+            owner.add_piece(piece)
+            layout.append((pos, piece))
+
+        # Remember home squares so reset() can reuse these pieces
+        self._initial_layout = tuple(layout)
+
+    def reset(self) -> None:
+        """
+        Return the game to its starting position in place.
 
-        # Blue player pieces (top, rows 0-2)
-        blue_player = self._players[1]
-        blue_pieces = [
-            # Row 0
-            Elephant(blue_player, Position(0, 0)),
-            Wolf(blue_player, Position(0, 2)),
-            Leopard(blue_player, Position(0, 4)),
-            Rat(blue_player, Position(0, 6)),
-            # Row 1
-            Cat(blue_player, Position(1, 1)),
-            Dog(blue_player, Position(1, 5)),
-            # Row 2
-            Tiger(blue_player, Position(2, 0)),
-            Lion(blue_player, Position(2, 6)),
-        ]
+        Reuses the existing board, players and pieces instead of allocating
+        new ones. Player names are kept; history and undo states are cleared.
+        """
+        self._board.reset_to_initial(self._initial_layout)
+
+        for player in self._players:
+            player.clear_pieces()
+        for _, piece in self._initial_layout:
+            piece.owner.add_piece(piece)
+
+        self._current_player_index = 0
+        self._move_history.clear()
+        self._undo_moves.clear()
+        self._game_status = GameStatus.ONGOING
+        self.rehash()
+
+    def rehash(self) -> None:
+        """
+        Recompute position_key from scratch.
 
-        # Place pieces on board and add to players
-        for piece in red_pieces:
-            self._board.set_piece(piece.position, piece)
-            red_player.add_piece(piece)
+        make_move and undo_move update the key incrementally; call this after
+        editing the board or turn directly, e.g. when restoring a saved game.
+        """
+        key = _ZOBRIST_BLUE_TO_MOVE if self._current_player_index == 1 else 0
+        for player in self._players:
+            for piece in player.get_active_pieces():
+                key ^= _zobrist_key(piece, piece.position)
+        self._zobrist = key
 
-        for piece in blue_pieces:
-            self._board.set_piece(piece.position, piece)
-            blue_player.add_piece(piece)
+    @property
+    def position_key(self) -> int:
+        """
+        Get a Zobrist hash of the piece placement and side to move.
+
+        Equal positions reached by different move orders share a key, so it
+        can be used as a dictionary key for caches.
+        """
+        return self._zobrist
 
     @property
     def board(self) -> Board:
@@ -147,12 +193,12 @@ class Game:
         Returns:
             The player who is not currently playing
         """
-        opponent_index = 1 - self._current_player_index
-        return self._players[opponent_index]
+        return self._players[1 - self._current_player_index]
 
     def _switch_turn(self) -> None:
         """Switch to the next player's turn."""
         self._current_player_index = 1 - self._current_player_index
+        self._zobrist ^= _ZOBRIST_BLUE_TO_MOVE
 
     def is_game_over(self) -> bool:
         """
@@ -183,14 +229,16 @@ class Game:
         Returns:
             True if there are moves to undo, False otherwise
         """
-        return len(self._game_states) > 0
+        return bool(self._undo_moves)
 
     def undo_move(self) -> bool:
         """
         Undo the last move and restore the previous game state.
 
-        This method restores the board state, current player, and removes
-        the last move from history. Can undo up to MAX_UNDO_MOVES moves.
+        The move is reversed in place: the moving piece returns to its source
+        square, any captured piece is put back on the target square and into
+        its owner's collection, and the turn passes back. The move is also
+        removed from history. Can undo up to MAX_UNDO_MOVES moves.
 
         Returns:
             True if undo was successful, False if no moves to undo
@@ -206,23 +254,24 @@ class Game:
         if not self.can_undo():
             return False
 
-        # Get the last saved state
-        last_state = self._game_states.pop()
-
-        # Restore the board state
-        last_state.restore_to_board(self._board)
+        # The last undoable move is also the last entry in history
+        move = self._undo_moves.pop()
+        self._move_history.pop()
 
-        # Restore current player
-        self._current_player_index = last_state.current_player_index
+        # Move the piece back and restore any captured piece
+        self._board.set_piece(move.from_pos, move.piece)
+        move.piece.position = move.from_pos
+        self._board.set_piece(move.to_pos, move.captured_piece)
+        self._zobrist ^= (_zobrist_key(move.piece, move.to_pos)
+                          ^ _zobrist_key(move.piece, move.from_pos))
 
-        # Remove the last move from history
-        if len(self._move_history) > 0:
-            removed_move = self._move_history.pop()
+        # The turn switched after the move, so the mover is the opponent now
+        self._switch_turn()
 
-            # If a piece was captured, restore it to the opponent's collection
-            if removed_move.captured_piece is not None:
-                opponent = self.get_opponent_player()
-                opponent.add_piece(removed_move.captured_piece)
+        if move.captured_piece is not None:
+            move.captured_piece.position = move.to_pos
+            self.get_opponent_player().add_piece(move.captured_piece)
+            self._zobrist ^= _zobrist_key(move.captured_piece, move.to_pos)
 
         return True
 
@@ -268,9 +317,6 @@ class Game:
         if target_piece is not None:
             captured_piece = self._validate_and_execute_capture(piece, target_piece)
 
-        # Save current game state for undo functionality
-        self._save_game_state()
-
         # Execute the move
         self._execute_move(piece, from_pos, to_pos, captured_piece)
 
@@ -429,10 +475,13 @@ class Game:
         self._board.set_piece(to_pos, piece)
         piece.position = to_pos
 
+        self._zobrist ^= _zobrist_key(piece, from_pos) ^ _zobrist_key(piece, to_pos)
+
         # Handle capture
         if captured_piece is not None:
             opponent = self.get_opponent_player()
             opponent.remove_piece(captured_piece)
+            self._zobrist ^= _zobrist_key(captured_piece, to_pos)
 
         # Record the move
         move = Move(
@@ -443,23 +492,20 @@ class Game:
             timestamp=datetime.now()
         )
         self._move_history.append(move)
+        self._push_undo_move(move)
 
-    def _save_game_state(self) -> None:
+    def _push_undo_move(self, move: Move) -> None:
         """
-        Save the current game state for undo functionality.
+        Remember a move so it can be undone.
 
-        Maintains a maximum of MAX_UNDO_MOVES states.
-        """
-        state = GameState.capture_from_board(
-            self._board,
-            self._current_player_index,
-            len(self._move_history)
-        )
-        self._game_states.append(state)
+        The move itself is the inverse delta (piece, source, target, captured
+        piece), so no board snapshot is taken. The bounded deque drops the
+        oldest move once MAX_UNDO_MOVES are held.
 
-        # Keep only the last MAX_UNDO_MOVES states
-        if len(self._game_states) > self.MAX_UNDO_MOVES:
-            self._game_states.pop(0)
+        Args:
+            move: The move just executed
+        """
+        self._undo_moves.append(move)
 
     def _check_victory_conditions(self, last_move_pos: Position, current_player: Player) -> None:
         """
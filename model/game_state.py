@@ -3,7 +3,9 @@ GameState class for Jungle Game.
 Represents an immutable snapshot of the game state for undo functionality.
 """
 
-from typing import Dict, Optional, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, TYPE_CHECKING
+from model.board import Board
 from model.position import Position
 
 if TYPE_CHECKING:
@@ -15,14 +17,18 @@ class GameState:
     Immutable game state snapshot for undo functionality.
 
     This class captures the complete state of the game at a specific point,
-    allowing the game to be restored to this state later.
+    allowing the game to be restored to this state later. The board is kept
+    as a flat row-major tuple of piece references (None for empty squares),
+    so a snapshot is one small allocation and pieces are never copied.
 
     Attributes:
-        board_state: Dictionary mapping positions to pieces (or None for empty)
+        board_state: Read-only mapping of occupied positions to pieces
         current_player_index: Index of the current player
         move_count: Number of moves made so far
     """
 
+    __slots__ = ('_cells', '_current_player_index', '_move_count', '_board_view', '_hash')
+
     def __init__(
         self,
         board_state: Dict[Position, Optional['Piece']],
@@ -37,15 +43,48 @@ class GameState:
             current_player_index: Index of the current player (0 or 1)
             move_count: Number of moves made so far
         """
-        # Store a deep copy of the board state to ensure immutability
-        self._board_state = board_state.copy()
+        cells = [None] * (Board.BOARD_HEIGHT * Board.BOARD_WIDTH)
+        for pos, piece in board_state.items():
+            if 0 <= pos.row < Board.BOARD_HEIGHT and 0 <= pos.col < Board.BOARD_WIDTH:
+                cells[pos.row * Board.BOARD_WIDTH + pos.col] = piece
+
+        self._cells: Tuple[Optional['Piece'], ...] = tuple(cells)
         self._current_player_index = current_player_index
         self._move_count = move_count
+        self._board_view: Optional[Mapping[Position, 'Piece']] = None
+        self._hash: Optional[int] = None
+
+    @classmethod
+    def _from_cells(
+        cls,
+        cells: Tuple[Optional['Piece'], ...],
+        current_player_index: int,
+        move_count: int
+    ) -> 'GameState':
+        """Build a state directly from a flat row-major tuple of cells."""
+        state = cls.__new__(cls)
+        state._cells = cells
+        state._current_player_index = current_player_index
+        state._move_count = move_count
+        state._board_view = None
+        state._hash = None
+        return state
 
     @property
-    def board_state(self) -> Dict[Position, Optional['Piece']]:
-        """Get the board state (returns a copy to maintain immutability)."""
-        return self._board_state.copy()
+    def board_state(self) -> Mapping[Position, 'Piece']:
+        """
+        Get a read-only view of the occupied positions.
+
+        The view is built on first access and shared afterwards; call
+        .copy() on it for a mutable dictionary.
+        """
+        if self._board_view is None:
+            self._board_view = MappingProxyType({
+                Position(*divmod(index, Board.BOARD_WIDTH)): piece
+                for index, piece in enumerate(self._cells)
+                if piece is not None
+            })
+        return self._board_view
 
     @property
     def current_player_index(self) -> int:
@@ -70,19 +109,8 @@ class GameState:
         Returns:
             A new GameState instance
         """
-        from model.board import Board
-
-        board_state: Dict[Position, Optional['Piece']] = {}
-
-        # Capture all pieces on the board
-        for row in range(Board.BOARD_HEIGHT):
-            for col in range(Board.BOARD_WIDTH):
-                pos = Position(row, col)
-                piece = board.get_piece(pos)
-                if piece is not None:
-                    board_state[pos] = piece
-
-        return GameState(board_state, current_player_index, move_count)
+        cells = tuple(board._grid)
+        return GameState._from_cells(cells, current_player_index, move_count)
 
     def restore_to_board(self, board: 'Board') -> None:
         """
@@ -91,20 +119,12 @@ class GameState:
         Args:
             board: The board to restore state to
         """
-        from model.board import Board
+        board._grid[:] = self._cells
 
-        # Clear the board first
-        for row in range(Board.BOARD_HEIGHT):
-            for col in range(Board.BOARD_WIDTH):
-                pos = Position(row, col)
-                board.set_piece(pos, None)
-
-        # Restore pieces from the saved state
-        for pos, piece in self._board_state.items():
+        # Update piece positions to match the saved positions
+        for index, piece in enumerate(self._cells):
             if piece is not None:
-                # Update piece position to match the saved position
-                piece.position = pos
-                board.set_piece(pos, piece)
+                piece.position = Position(*divmod(index, Board.BOARD_WIDTH))
 
     def __eq__(self, other: object) -> bool:
         """
@@ -116,19 +136,31 @@ class GameState:
         Returns:
             True if states are equal, False otherwise
         """
+        if self is other:
+            return True
         if not isinstance(other, GameState):
             return False
+        # Cached hashes that differ settle inequality without a cell scan
+        if (self._hash is not None and other._hash is not None
+                and self._hash != other._hash):
+            return False
 
         return (
             self._current_player_index == other._current_player_index
             and self._move_count == other._move_count
-            and self._board_state == other._board_state
+            and self._cells == other._cells
         )
 
+    def __hash__(self) -> int:
+        """Generate hash for use in sets and dictionaries, computed once."""
+        if self._hash is None:
+            self._hash = hash((self._cells, self._current_player_index, self._move_count))
+        return self._hash
+
     def __repr__(self) -> str:
         """Developer-friendly representation."""
         return (
             f"GameState(current_player={self._current_player_index}, "
             f"move_count={self._move_count}, "
-            f"pieces={len(self._board_state)})"
+            f"pieces={sum(piece is not None for piece in self._cells)})"
         )
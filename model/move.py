@@ -3,6 +3,7 @@ Move and MoveResult classes for Jungle Game.
 Handles move tracking and operation feedback.
 """
 
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict, Any, TYPE_CHECKING
@@ -12,8 +13,14 @@ from model.position import Position
 if TYPE_CHECKING:
     from model.piece import Piece
 
+# Pattern: "Player - PieceType from (row,col) to (row,col) [(captured PieceType)]"
+RECORD_STRING_PATTERN = re.compile(
+    r"(.+?) - (\w+) from \((\d+),(\d+)\) to \((\d+),(\d+)\)"
+    r"(?: \(captured (\w+)\))?"
+)
 
-@dataclass
+
+@dataclass(init=False)
 class MoveResult:
     """
     Result of a move operation.
@@ -26,9 +33,19 @@ class MoveResult:
         message: Descriptive message about the move result
         captured_piece: The piece that was captured, if any
     """
+    # __slots__ cannot coexist with a dataclass field default, so the
+    # optional captured_piece is handled by an explicit __init__
+    __slots__ = ('success', 'message', 'captured_piece')
+
     success: bool
     message: str
-    captured_piece: Optional['Piece'] = None
+    captured_piece: Optional['Piece']
+
+    def __init__(self, success: bool, message: str,
+                 captured_piece: Optional['Piece'] = None):
+        self.success = success
+        self.message = message
+        self.captured_piece = captured_piece
 
 
 @dataclass
@@ -46,6 +63,8 @@ class Move:
         captured_piece: The piece that was captured, if any
         timestamp: When the move was made
     """
+    __slots__ = ('piece', 'from_pos', 'to_pos', 'captured_piece', 'timestamp')
+
     piece: 'Piece'
     from_pos: Position
     to_pos: Position
@@ -164,15 +183,7 @@ class Move:
         Raises:
             ValueError: If the string format is invalid
         """
-        import re
-
-        # Pattern: "Player - PieceType from (row,col) to (row,col) [(captured PieceType)]"
-        pattern = (
-            r"(.+?) - (\w+) from \((\d+),(\d+)\) to \((\d+),(\d+)\)"
-            r"(?: \(captured (\w+)\))?"
-        )
-
-        match = re.match(pattern, record_str)
+        match = RECORD_STRING_PATTERN.match(record_str)
         if not match:
             raise ValueError(f"Invalid record string format: {record_str}")
 
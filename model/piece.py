@@ -24,6 +24,8 @@ class Piece(ABC):
         position: Current position on the board
     """
     
+    __slots__ = ('_rank', '_owner', '_position')
+    
     def __init__(self, rank: int, owner: 'Player', position: Position):
         """
         Initialize a piece.
@@ -115,6 +117,8 @@ class StandardLandPiece(Piece):
     cannot enter water, and capture based on rank.
     """
     
+    __slots__ = ()
+    
     def can_move_to(self, board: 'Board', target: Position) -> bool:
         """
         Check if this piece can move to the target position.
@@ -203,6 +207,8 @@ class Cat(StandardLandPiece):
     Standard land animal with normal movement and capture rules.
     """
     
+    __slots__ = ()
+    
     def __init__(self, owner: 'Player', position: Position):
         """
         Initialize a Cat piece.
@@ -220,6 +226,8 @@ class Dog(StandardLandPiece):
     Standard land animal with normal movement and capture rules.
     """
     
+    __slots__ = ()
+    
     def __init__(self, owner: 'Player', position: Position):
         """
         Initialize a Dog piece.
@@ -237,6 +245,8 @@ class Wolf(StandardLandPiece):
     Standard land animal with normal movement and capture rules.
     """
     
+    __slots__ = ()
+    
     def __init__(self, owner: 'Player', position: Position):
         """
         Initialize a Wolf piece.
@@ -254,6 +264,8 @@ class Leopard(StandardLandPiece):
     Standard land animal with normal movement and capture rules.
     """
     
+    __slots__ = ()
+    
     def __init__(self, owner: 'Player', position: Position):
         """
         Initialize a Leopard piece.
@@ -271,6 +283,8 @@ class Elephant(StandardLandPiece):
     Standard land animal but cannot capture rats.
     """
     
+    __slots__ = ()
+    
     def __init__(self, owner: 'Player', position: Position):
         """
         Initialize an Elephant piece.
@@ -310,6 +324,8 @@ class Rat(Piece):
     Cannot capture rats across water/land boundaries.
     """
     
+    __slots__ = ()
+    
     def __init__(self, owner: 'Player', position: Position):
         """
         Initialize a Rat piece.
@@ -424,6 +440,8 @@ class Lion(StandardLandPiece):
     Can jump over rivers horizontally or vertically if no rat blocks the path.
     """
     
+    __slots__ = ()
+    
     def __init__(self, owner: 'Player', position: Position):
         """
         Initialize a Lion piece.
@@ -558,6 +576,8 @@ class Tiger(StandardLandPiece):
     Can jump over rivers horizontally or vertically if no rat blocks the path.
     """
     
+    __slots__ = ()
+    
     def __init__(self, owner: 'Player', position: Position):
         """
         Initialize a Tiger piece.
@@ -3,7 +3,7 @@ Player class for Jungle Game.
 Represents a player with name, color, and piece ownership.
 """
 
-from typing import List, Set, TYPE_CHECKING
+from typing import List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
 from model.enums import PlayerColor
 from model.position import Position
 
@@ -32,6 +32,7 @@ class Player:
         self._name = name
         self._color = color
         self._pieces: Set['Piece'] = set()
+        self._active_cache: Optional[Tuple['Piece', ...]] = None
 
     @property
     def name(self) -> str:
@@ -56,6 +57,7 @@ class Player:
             piece: The piece to add
         """
         self._pieces.add(piece)
+        self._active_cache = None
 
     def remove_piece(self, piece: 'Piece') -> None:
         """
@@ -65,15 +67,25 @@ class Player:
             piece: The piece to remove
         """
         self._pieces.discard(piece)
+        self._active_cache = None
 
-    def get_active_pieces(self) -> List['Piece']:
+    def clear_pieces(self) -> None:
+        """Remove all pieces from this player's collection."""
+        self._pieces.clear()
+        self._active_cache = None
+
+    def get_active_pieces(self) -> Sequence['Piece']:
         """
         Get all active pieces owned by this player.
 
+        The tuple is cached until the next add, remove or clear.
+
         Returns:
-            List of active pieces
+            Tuple of active pieces
         """
-        return list(self._pieces)
+        if self._active_cache is None:
+            self._active_cache = tuple(self._pieces)
+        return self._active_cache
 
     def has_pieces(self) -> bool:
         """
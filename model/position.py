@@ -3,29 +3,72 @@ Position class for Jungle Game.
 Represents an immutable position on the game board.
 """
 
-from typing import Optional
+from typing import List, Optional
 from model.enums import Direction
 
+# Board dimensions for the interning pool (kept in step with Board, which
+# imports this module and so cannot be imported here)
+_POOL_ROWS = 9
+_POOL_COLS = 7
+
 
 class Position:
     """
     Immutable position representation on the game board.
-    
+
+    Positions on the board are interned: ``Position(r, c)`` returns the same
+    object every time, so board squares are allocated once. Off-board
+    positions (used to report invalid input) are created on demand.
+
     Attributes:
         row: The row index (0-8 for a 9-row board)
         col: The column index (0-6 for a 7-column board)
     """
-    
-    def __init__(self, row: int, col: int):
+
+    __slots__ = ('_row', '_col', '_hash', '_index')
+
+    _pool: List[List[Optional['Position']]] = [
+        [None] * _POOL_COLS for _ in range(_POOL_ROWS)
+    ]
+
+    def __new__(cls, row: int, col: int) -> 'Position':
         """
-        Initialize a position.
-        
+        Get the position for a row and column.
+
         Args:
             row: The row index
             col: The column index
+
+        Returns:
+            The interned Position for on-board squares, else a new Position
         """
-        self._row = row
-        self._col = col
+        on_board = 0 <= row < _POOL_ROWS and 0 <= col < _POOL_COLS
+        if on_board:
+            pos = cls._pool[row][col]
+            if pos is not None:
+                return pos
+
+        pos = super().__new__(cls)
+        pos._row = row
+        pos._col = col
+        pos._hash = hash((row, col))
+        # Row-major index into Board's flat grid (meaningful on the board only)
+        pos._index = row * _POOL_COLS + col
+        if on_board:
+            cls._pool[row][col] = pos
+        return pos
+
+    def __reduce__(self):
+        """Pickle and copy through the constructor so interning holds."""
+        return (Position, (self._row, self._col))
+
+    def __copy__(self) -> 'Position':
+        """Positions are immutable, so a copy is the same object."""
+        return self
+
+    def __deepcopy__(self, memo) -> 'Position':
+        """Positions are immutable, so a deep copy is the same object."""
+        return self
     
     @property
     def row(self) -> int:
@@ -97,13 +140,15 @@ class Position:
     
     def __eq__(self, other: object) -> bool:
         """Check equality with another position."""
+        if self is other:
+            return True
         if not isinstance(other, Position):
             return False
-        return self.row == other.row and self.col == other.col
+        return self._row == other._row and self._col == other._col
     
     def __hash__(self) -> int:
         """Generate hash for use in sets and dictionaries."""
-        return hash((self.row, self.col))
+        return self._hash
     
     def __str__(self) -> str:
         """String representation of the position."""
@@ -0,0 +1,19 @@
+"""
+Test runner for Jungle Game.
+Run the whole suite from the project root with ``python -m tests``.
+"""
+
+import sys
+import unittest
+
+
+def main() -> int:
+    """Discover and run every test module under tests/."""
+    loader = unittest.TestLoader()
+    suite = loader.discover("tests", pattern="test_*.py", top_level_dir=".")
+    result = unittest.TextTestRunner(verbosity=1).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
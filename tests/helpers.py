@@ -0,0 +1,44 @@
+"""
+Shared constants and assertion helpers for the Jungle Game test suite.
+Not a test module, so discovery never collects it on its own.
+"""
+
+import os
+import unittest
+
+# Keep scratch files on a RAM-backed filesystem when the platform has one
+TEMP_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+class LenAssertions:
+    """Mixin adding a length assertion to TestCase classes."""
+
+    def assertLen(self, container, expected, msg=None):
+        """Assert that container holds exactly expected items."""
+        self.assertEqual(len(container), expected, msg)
+
+
+class SubstringAssertions:
+    """Mixin adding a multi-substring assertion to TestCase classes."""
+
+    def assertContainsAll(self, text, expected, msg=None):
+        """Assert that every string in expected occurs in text, listing any missing."""
+        missing = [part for part in expected if part not in text]
+        if missing:
+            self.fail(self._formatMessage(msg, f"missing {missing!r} in output"))
+
+
+class ErrorMessageTestCase(unittest.TestCase):
+    """Base test case with helpers for checking exception messages."""
+
+    def assertExceptionMessageContains(self, context, *fragments):
+        """
+        Assert that a caught exception's message contains every fragment.
+
+        Args:
+            context: The context manager returned by assertRaises
+            *fragments: Substrings expected in the exception message
+        """
+        message = str(context.exception)
+        missing = [fragment for fragment in fragments if fragment not in message]
+        self.assertFalse(missing, f"{missing} not found in {message!r}")
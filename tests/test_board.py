@@ -22,6 +22,11 @@ class TestBoardInitialization(unittest.TestCase):
         self.assertEqual(Board.BOARD_HEIGHT, 9)
         self.assertEqual(Board.BOARD_WIDTH, 7)
 
+    def test_position_index_matches_board_layout(self):
+        """Test that Position's flat grid index agrees with the board width."""
+        self.assertEqual(Position(2, 3)._index, 2 * Board.BOARD_WIDTH + 3)
+        self.assertEqual(Position(8, 6)._index, Board.BOARD_HEIGHT * Board.BOARD_WIDTH - 1)
+
     def test_board_grid_initialized(self):
         """Test that board grid is properly initialized with None values."""
         for row in range(Board.BOARD_HEIGHT):
@@ -29,6 +34,10 @@ class TestBoardInitialization(unittest.TestCase):
                 pos = Position(row, col)
                 self.assertIsNone(self.board.get_piece(pos))
 
+    def test_terrain_map_shared_between_boards(self):
+        """Test that boards reuse one terrain map instead of rebuilding it."""
+        self.assertIs(Board()._terrain_map, self.board._terrain_map)
+
     def test_terrain_map_initialized(self):
         """Test that terrain map is initialized with correct terrain types."""
         # Check that water squares are set
@@ -115,6 +124,60 @@ class TestPiecePlacement(unittest.TestCase):
         self.board.set_piece(pos, None)
         self.assertIsNone(self.board.get_piece(pos))
 
+    def test_place_unchecked_sets_piece_and_position(self):
+        """Test that place_unchecked places a piece and updates its position."""
+        from model.piece import Wolf
+        piece = Wolf(self.player, Position(0, 0))
+        pos = Position(4, 3)
+
+        self.board.place_unchecked(pos, piece)
+
+        self.assertIs(self.board.get_piece(pos), piece)
+        self.assertEqual(piece.position, pos)
+
+    def test_snapshot_pieces(self):
+        """Test that snapshot_pieces maps only occupied squares to pieces."""
+        from model.piece import Wolf
+        piece = Wolf(self.player, Position(0, 0))
+        self.board.place_unchecked(Position(4, 3), piece)
+
+        self.assertEqual(self.board.snapshot_pieces(), {Position(4, 3): piece})
+
+    def test_is_empty(self):
+        """Test that is_empty tracks whether any square holds a piece."""
+        from model.piece import Wolf
+        self.assertTrue(self.board.is_empty())
+
+        self.board.place_unchecked(Position(4, 3), Wolf(self.player, Position(0, 0)))
+        self.assertFalse(self.board.is_empty())
+
+        self.board.set_piece(Position(4, 3), None)
+        self.assertTrue(self.board.is_empty())
+
+    def test_clear_empties_board(self):
+        """Test that clear removes every piece from the board."""
+        from model.piece import Wolf
+        self.board.place_unchecked(Position(4, 3), Wolf(self.player, Position(0, 0)))
+        self.board.place_unchecked(Position(0, 0), Wolf(self.player, Position(0, 0)))
+
+        self.board.clear()
+
+        self.assertTrue(self.board.is_empty())
+
+    def test_reset_to_initial_clears_and_places_layout(self):
+        """Test that reset_to_initial empties the board then places the layout."""
+        from model.piece import Wolf
+        piece = Wolf(self.player, Position(0, 0))
+        home = Position(0, 2)
+        stray = Position(4, 3)
+        self.board.place_unchecked(stray, piece)
+
+        self.board.reset_to_initial([(home, piece)])
+
+        self.assertIsNone(self.board.get_piece(stray))
+        self.assertIs(self.board.get_piece(home), piece)
+        self.assertEqual(piece.position, home)
+
     def test_get_piece_invalid_position(self):
         """Test getting piece from invalid position returns None."""
         invalid_pos = Position(-1, 5)
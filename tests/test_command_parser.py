@@ -7,6 +7,11 @@ from controller.command_parser import CommandParser
 from model.position import Position
 from model.exceptions import InvalidPositionException
 
+# Shared expected positions; Position is immutable so these are safe to reuse
+POS_00 = Position(0, 0)
+POS_11 = Position(1, 1)
+POS_86 = Position(8, 6)
+
 
 class TestCommandParser(unittest.TestCase):
     """Test cases for CommandParser class."""
@@ -14,62 +19,62 @@ class TestCommandParser(unittest.TestCase):
     def test_parse_chess_notation_lowercase(self):
         """Test parsing chess-like notation with lowercase letters."""
         from_pos, to_pos = CommandParser.parse_move_command("a0 b1")
-        self.assertEqual(from_pos, Position(0, 0))
-        self.assertEqual(to_pos, Position(1, 1))
+        self.assertEqual(from_pos, POS_00)
+        self.assertEqual(to_pos, POS_11)
 
     def test_parse_chess_notation_uppercase(self):
         """Test parsing chess-like notation with uppercase letters."""
         from_pos, to_pos = CommandParser.parse_move_command("A0 B1")
-        self.assertEqual(from_pos, Position(0, 0))
-        self.assertEqual(to_pos, Position(1, 1))
+        self.assertEqual(from_pos, POS_00)
+        self.assertEqual(to_pos, POS_11)
 
     def test_parse_chess_notation_mixed_case(self):
         """Test parsing chess-like notation with mixed case."""
         from_pos, to_pos = CommandParser.parse_move_command("a0 B1")
-        self.assertEqual(from_pos, Position(0, 0))
-        self.assertEqual(to_pos, Position(1, 1))
+        self.assertEqual(from_pos, POS_00)
+        self.assertEqual(to_pos, POS_11)
 
     def test_parse_numeric_notation_comma(self):
         """Test parsing numeric notation with commas."""
         from_pos, to_pos = CommandParser.parse_move_command("0,0 1,1")
-        self.assertEqual(from_pos, Position(0, 0))
-        self.assertEqual(to_pos, Position(1, 1))
+        self.assertEqual(from_pos, POS_00)
+        self.assertEqual(to_pos, POS_11)
 
     def test_parse_numeric_notation_parentheses(self):
         """Test parsing numeric notation with parentheses."""
         from_pos, to_pos = CommandParser.parse_move_command("(0,0) (1,1)")
-        self.assertEqual(from_pos, Position(0, 0))
-        self.assertEqual(to_pos, Position(1, 1))
+        self.assertEqual(from_pos, POS_00)
+        self.assertEqual(to_pos, POS_11)
 
     def test_parse_numeric_notation_space_separated(self):
         """Test parsing numeric notation with spaces instead of commas."""
         from_pos, to_pos = CommandParser.parse_move_command("0 0 1 1")
-        self.assertEqual(from_pos, Position(0, 0))
-        self.assertEqual(to_pos, Position(1, 1))
+        self.assertEqual(from_pos, POS_00)
+        self.assertEqual(to_pos, POS_11)
 
     def test_parse_verbose_chess_notation(self):
         """Test parsing verbose format with 'move from to' keywords."""
         from_pos, to_pos = CommandParser.parse_move_command("move from a0 to b1")
-        self.assertEqual(from_pos, Position(0, 0))
-        self.assertEqual(to_pos, Position(1, 1))
+        self.assertEqual(from_pos, POS_00)
+        self.assertEqual(to_pos, POS_11)
 
     def test_parse_verbose_numeric_notation(self):
         """Test parsing verbose numeric format."""
         from_pos, to_pos = CommandParser.parse_move_command("move from 0,0 to 1,1")
-        self.assertEqual(from_pos, Position(0, 0))
-        self.assertEqual(to_pos, Position(1, 1))
+        self.assertEqual(from_pos, POS_00)
+        self.assertEqual(to_pos, POS_11)
 
     def test_parse_with_extra_whitespace(self):
         """Test parsing with extra whitespace."""
         from_pos, to_pos = CommandParser.parse_move_command("  a0   b1  ")
-        self.assertEqual(from_pos, Position(0, 0))
-        self.assertEqual(to_pos, Position(1, 1))
+        self.assertEqual(from_pos, POS_00)
+        self.assertEqual(to_pos, POS_11)
 
     def test_parse_edge_positions(self):
         """Test parsing positions at board edges."""
         from_pos, to_pos = CommandParser.parse_move_command("g8 a0")
-        self.assertEqual(from_pos, Position(8, 6))
-        self.assertEqual(to_pos, Position(0, 0))
+        self.assertEqual(from_pos, POS_86)
+        self.assertEqual(to_pos, POS_00)
 
     def test_parse_invalid_empty_command(self):
         """Test that empty command raises InvalidInputException."""
@@ -179,23 +184,20 @@ class TestCommandParser(unittest.TestCase):
         """Test that sanitization removes leading/trailing whitespace."""
         # Test via parse_move_command which uses _sanitize_input internally
         from_pos, to_pos = CommandParser.parse_move_command("  a0   b1  ")
-        self.assertEqual(from_pos, Position(0, 0))
-        self.assertEqual(to_pos, Position(1, 1))
+        self.assertEqual(from_pos, POS_00)
+        self.assertEqual(to_pos, POS_11)
 
     def test_sanitize_input_normalizes_spaces(self):
         """Test that sanitization normalizes multiple spaces."""
         # Test via parse_move_command which uses _sanitize_input internally
         from_pos, to_pos = CommandParser.parse_move_command("a0    b1")
-        self.assertEqual(from_pos, Position(0, 0))
-        self.assertEqual(to_pos, Position(1, 1))
+        self.assertEqual(from_pos, POS_00)
+        self.assertEqual(to_pos, POS_11)
 
     def test_format_position(self):
         """Test formatting a position as chess notation."""
-        pos = Position(0, 0)
-        self.assertEqual(CommandParser.format_position(pos), "a0")
-
-        pos = Position(8, 6)
-        self.assertEqual(CommandParser.format_position(pos), "g8")
+        self.assertEqual(CommandParser.format_position(POS_00), "a0")
+        self.assertEqual(CommandParser.format_position(POS_86), "g8")
 
         pos = Position(3, 2)
         self.assertEqual(CommandParser.format_position(pos), "c3")
@@ -208,10 +210,25 @@ class TestCommandParser(unittest.TestCase):
 
     def test_parse_all_valid_rows(self):
         """Test parsing all valid row numbers."""
-        for row in range(9):
-            from_pos, _ = CommandParser.parse_move_command(f"a{row} b0")
+        results = CommandParser.parse_move_commands(f"a{row} b0" for row in range(9))
+        self.assertEqual(len(results), 9)
+        for row, (from_pos, _) in enumerate(results):
             self.assertEqual(from_pos.row, row)
 
+    def test_parse_move_commands_matches_single_parse(self):
+        """Test that batch parsing agrees with parsing each command alone."""
+        commands = ["a0 b1", "0,0 1,1", "move from g8 to a0"]
+        self.assertEqual(
+            CommandParser.parse_move_commands(commands),
+            [CommandParser.parse_move_command(command) for command in commands]
+        )
+
+    def test_parse_move_commands_invalid_command(self):
+        """Test that an invalid command in a batch raises InvalidInputException."""
+        from model.exceptions import InvalidInputException
+        with self.assertRaises(InvalidInputException):
+            CommandParser.parse_move_commands(["a0 b1", "invalid command"])
+
     def test_parse_case_insensitive_keywords(self):
         """Test that keywords are case insensitive."""
         from_pos1, to_pos1 = CommandParser.parse_move_command("MOVE FROM a0 TO b1")
@@ -1,147 +1,19 @@
 """
 Unit tests for comprehensive error handling and validation.
-Tests error scenarios across the application.
+Tests error scenarios in command parsing and validation helpers.
+Game error scenarios live in test_game_error_handling.py.
 """
 
 import unittest
-from model.game import Game
-from model.position import Position
 from model.exceptions import (
-    GameOverException,
     InvalidPositionException,
-    PieceNotFoundException,
-    WrongPlayerException,
-    InvalidMoveException,
-    InvalidCaptureException,
     InvalidInputException
 )
 from controller.command_parser import CommandParser
+from tests.helpers import ErrorMessageTestCase
 
 
-class TestGameErrorHandling(unittest.TestCase):
-    """Test error handling in Game class."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.game = Game("Alice", "Bob")
-
-    def test_move_after_game_over_raises_exception(self):
-        """Test that moving after game over raises GameOverException."""
-        # Force game over by moving to opponent's den
-        # This requires multiple moves to reach the den
-        self.game._game_status = self.game._game_status.__class__.PLAYER_ONE_WINS
-        
-        with self.assertRaises(GameOverException) as context:
-            self.game.make_move(Position(8, 0), Position(7, 0))
-        
-        self.assertIn("Cannot make moves after game is over", str(context.exception))
-
-    def test_invalid_source_position_raises_exception(self):
-        """Test that invalid source position raises InvalidPositionException."""
-        with self.assertRaises(InvalidPositionException) as context:
-            self.game.make_move(Position(10, 0), Position(7, 0))
-        
-        self.assertIn("out of bounds", str(context.exception))
-
-    def test_invalid_target_position_raises_exception(self):
-        """Test that invalid target position raises InvalidPositionException."""
-        with self.assertRaises(InvalidPositionException) as context:
-            self.game.make_move(Position(8, 0), Position(10, 0))
-        
-        self.assertIn("out of bounds", str(context.exception))
-
-    def test_same_source_and_target_raises_exception(self):
-        """Test that same source and target raises InvalidMoveException."""
-        with self.assertRaises(InvalidMoveException) as context:
-            self.game.make_move(Position(8, 0), Position(8, 0))
-        
-        self.assertIn("cannot be the same", str(context.exception))
-
-    def test_no_piece_at_source_raises_exception(self):
-        """Test that no piece at source raises PieceNotFoundException."""
-        with self.assertRaises(PieceNotFoundException) as context:
-            self.game.make_move(Position(4, 3), Position(5, 3))
-        
-        self.assertIn("No piece found", str(context.exception))
-
-    def test_wrong_player_piece_raises_exception(self):
-        """Test that moving opponent's piece raises WrongPlayerException."""
-        # Try to move blue piece when it's red's turn
-        with self.assertRaises(WrongPlayerException) as context:
-            self.game.make_move(Position(0, 0), Position(1, 0))
-        
-        self.assertIn("belongs to", str(context.exception))
-        self.assertIn("not", str(context.exception))
-
-    def test_invalid_move_diagonal_raises_exception(self):
-        """Test that diagonal move raises InvalidMoveException."""
-        with self.assertRaises(InvalidMoveException) as context:
-            self.game.make_move(Position(8, 0), Position(7, 1))
-        
-        self.assertIn("one square horizontally or vertically", str(context.exception))
-
-    def test_invalid_move_into_water_raises_exception(self):
-        """Test that non-rat moving into water raises InvalidMoveException."""
-        # Move cat to position where it could try to enter water
-        self.game.make_move(Position(7, 5), Position(6, 5))  # Red Cat
-        self.game.make_move(Position(1, 1), Position(2, 1))  # Blue Cat
-        
-        # Try to move cat into water (5,5 is water)
-        with self.assertRaises(InvalidMoveException) as context:
-            self.game.make_move(Position(6, 5), Position(5, 5))  # Water at (5,5)
-        
-        self.assertIn("cannot move into water", str(context.exception))
-
-    def test_invalid_move_into_own_den_raises_exception(self):
-        """Test that moving into own den raises InvalidMoveException."""
-        # Clear the board and place a piece next to its own den
-        # Red den is at (8,3)
-        from model.piece import Wolf
-        
-        # Clear board
-        for row in range(9):
-            for col in range(7):
-                self.game.board.set_piece(Position(row, col), None)
-        
-        # Place a red wolf next to red den
-        red_player = self.game.players[0]
-        wolf = Wolf(red_player, Position(7, 3))
-        self.game.board.set_piece(Position(7, 3), wolf)
-        
-        # Try to move into own den
-        with self.assertRaises(InvalidMoveException) as context:
-            self.game.make_move(Position(7, 3), Position(8, 3))  # Red den at (8,3)
-        
-        self.assertIn("cannot move into its own den", str(context.exception))
-
-    def test_invalid_capture_own_piece_raises_exception(self):
-        """Test that capturing own piece raises InvalidCaptureException."""
-        # This should be caught by move validation, but test the capture validation
-        # Move pieces to adjacent positions
-        self.game.make_move(Position(8, 0), Position(7, 0))  # Red Rat
-        self.game.make_move(Position(0, 6), Position(1, 6))  # Blue Rat
-        
-        # Manually test capture validation by trying to capture own piece
-        # This is tested indirectly through move validation
-        pass
-
-    def test_undo_after_game_over_raises_exception(self):
-        """Test that undo after game over raises GameOverException."""
-        self.game.make_move(Position(8, 0), Position(7, 0))
-        self.game._game_status = self.game._game_status.__class__.PLAYER_ONE_WINS
-        
-        with self.assertRaises(GameOverException) as context:
-            self.game.undo_move()
-        
-        self.assertIn("Cannot undo moves after game is over", str(context.exception))
-
-    def test_undo_with_no_moves_returns_false(self):
-        """Test that undo with no moves returns False."""
-        result = self.game.undo_move()
-        self.assertFalse(result)
-
-
-class TestCommandParserErrorHandling(unittest.TestCase):
+class TestCommandParserErrorHandling(ErrorMessageTestCase):
     """Test error handling in CommandParser."""
 
     def test_empty_command_raises_exception(self):
@@ -149,21 +21,21 @@ class TestCommandParserErrorHandling(unittest.TestCase):
         with self.assertRaises(InvalidInputException) as context:
             CommandParser.parse_move_command("")
         
-        self.assertIn("cannot be empty", str(context.exception))
+        self.assertExceptionMessageContains(context, "cannot be empty")
 
     def test_whitespace_only_command_raises_exception(self):
         """Test that whitespace-only command raises InvalidInputException."""
         with self.assertRaises(InvalidInputException) as context:
             CommandParser.parse_move_command("   ")
         
-        self.assertIn("cannot be empty", str(context.exception))
+        self.assertExceptionMessageContains(context, "cannot be empty")
 
     def test_invalid_format_raises_exception(self):
         """Test that invalid format raises InvalidInputException."""
         with self.assertRaises(InvalidInputException) as context:
             CommandParser.parse_move_command("invalid command")
         
-        self.assertIn("Invalid command format", str(context.exception))
+        self.assertExceptionMessageContains(context, "Invalid command format")
 
     def test_invalid_column_letter_raises_exception(self):
         """Test that invalid column letter raises exception."""
@@ -185,7 +57,7 @@ class TestCommandParserErrorHandling(unittest.TestCase):
         with self.assertRaises(InvalidPositionException) as context:
             CommandParser.parse_position(10, 0)
         
-        self.assertIn("out of bounds", str(context.exception))
+        self.assertExceptionMessageContains(context, "out of bounds")
 
     def test_negative_row_raises_exception(self):
         """Test that negative row raises InvalidPositionException."""
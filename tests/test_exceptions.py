@@ -9,6 +9,7 @@ from model.exceptions import (
     InvalidPositionException,
     GameOverException,
     FileOperationException,
+    FileOpError,
     InvalidInputException,
     PieceNotFoundException,
     WrongPlayerException,
@@ -50,6 +51,14 @@ class TestExceptions(unittest.TestCase):
         self.assertIsInstance(exc, JungleGameException)
         self.assertIsInstance(exc, Exception)
     
+    def test_file_operation_exception_code(self):
+        """Test FileOperationException carries an optional error code."""
+        self.assertIsNone(FileOperationException("File error").code)
+
+        exc = FileOperationException("Missing", code=FileOpError.NOT_FOUND)
+        self.assertIs(exc.code, FileOpError.NOT_FOUND)
+        self.assertEqual(str(exc), "Missing")
+    
     def test_invalid_input_exception_inheritance(self):
         """Test InvalidInputException inherits from JungleGameException."""
         exc = InvalidInputException("Invalid input")
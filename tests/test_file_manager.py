@@ -4,34 +4,79 @@ Tests save/load functionality for .jungle files.
 """
 
 import unittest
+import importlib.util
 import json
+import os
+import shutil
+import sys
 import tempfile
+import types
 from pathlib import Path
+from unittest.mock import patch
 
+from controller import file_manager
 from controller.file_manager import FileManager
 from model.game import Game
 from model.position import Position
 from model.enums import GameStatus
-from model.exceptions import FileOperationException
+from model.exceptions import FileOperationException, FileOpError
+from tests.helpers import TEMP_ROOT
 
+# One decoder shared by every test that inspects saved JSON
+_DECODER = json.JSONDecoder()
 
-class TestFileManagerSaveLoad(unittest.TestCase):
-    """Test cases for FileManager save and load operations."""
+# Red Rat then Blue Rat, in the shape load_record returns
+OPENING_MOVES = [
+    {'from_row': 8, 'from_col': 0, 'to_row': 7, 'to_col': 0},
+    {'from_row': 0, 'from_col': 6, 'to_row': 1, 'to_col': 6},
+]
+
+
+class FileManagerTestCase(unittest.TestCase):
+    """Shared fixtures for FileManager tests."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Build the template game and one scratch directory per class."""
+        cls._template_game = Game("Alice", "Bob")
+        cls.temp_dir = tempfile.mkdtemp(dir=TEMP_ROOT)
+        cls.temp_path = Path(cls.temp_dir)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def _temp_file(self, suffix: str = '') -> Path:
+        """Return a scratch file path unique to the running test."""
+        return self.temp_path / f"{self._testMethodName}{suffix}"
+
+    def _parse(self, path: Path):
+        """Parse a saved JSON file with the shared decoder."""
+        return _DECODER.decode(path.read_text(encoding='utf-8'))
+
+
+class TestFileManagerSaveLoad(FileManagerTestCase):
+    """Test cases for FileManager save and load operations."""
+
+    def _save_and_parse(self, game=None):
+        """
+        Save a game to this test's scratch file and return the parsed JSON.
+
+        Args:
+            game: The game to save, or None for the template game
+
+        Returns:
+            The parsed save document
+        """
+        filepath = self._temp_file('.jungle')
+        FileManager.save_game(game or self._template_game, str(filepath))
+        return self._parse(filepath)
 
     def test_save_game_creates_file(self):
         """Test that save_game creates a .jungle file."""
         game = Game("Alice", "Bob")
-        filepath = self.temp_path / "test_game.jungle"
+        filepath = self._temp_file('.jungle')
 
         result = FileManager.save_game(game, str(filepath))
 
@@ -41,136 +86,194 @@ class TestFileManagerSaveLoad(unittest.TestCase):
     def test_save_game_adds_extension(self):
         """Test that save_game adds .jungle extension if missing."""
         game = Game("Alice", "Bob")
-        filepath = self.temp_path / "test_game"
+        filepath = self._temp_file()
 
         FileManager.save_game(game, str(filepath))
 
-        jungle_file = self.temp_path / "test_game.jungle"
+        jungle_file = self._temp_file('.jungle')
         self.assertTrue(jungle_file.exists())
 
-    def test_save_game_valid_json(self):
-        """Test that saved file contains valid JSON."""
-        game = Game("Alice", "Bob")
-        filepath = self.temp_path / "test_game.jungle"
+    def test_save_game_content(self):
+        """Test that a saved game contains every expected section."""
+        data = self._save_and_parse()
 
-        FileManager.save_game(game, str(filepath))
+        with self.subTest(aspect='valid_json'):
+            self.assertIn('version', data)
+            self.assertIn('players', data)
+            self.assertIn('board_state', data)
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with self.subTest(aspect='players'):
+            self.assertEqual(len(data['players']), 2)
+            self.assertEqual(data['players'][0]['name'], "Alice")
+            self.assertEqual(data['players'][1]['name'], "Bob")
+            self.assertEqual(data['players'][0]['color'], "red")
+            self.assertEqual(data['players'][1]['color'], "blue")
 
-        self.assertIn('version', data)
-        self.assertIn('players', data)
-        self.assertIn('board_state', data)
+        with self.subTest(aspect='board_state'):
+            # One code per square, 16 of them occupied (8 per player)
+            self.assertEqual(len(data['board_state']), 63)
+            self.assertEqual(sum(1 for code in data['board_state'] if code), 16)
 
-    def test_save_game_includes_player_info(self):
-        """Test that saved game includes player information."""
-        game = Game("Alice", "Bob")
-        filepath = self.temp_path / "test_game.jungle"
+            # Red Rat (rank 1) at 8,0 and Blue Elephant (rank 8 + 8) at 0,0
+            self.assertEqual(data['board_state'][8 * 7 + 0], 1)
+            self.assertEqual(data['board_state'][0 * 7 + 0], 16)
 
-        FileManager.save_game(game, str(filepath))
+        with self.subTest(aspect='current_player'):
+            self.assertEqual(data['current_player'], 0)
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with self.subTest(aspect='game_status'):
+            self.assertEqual(data['game_status'], 'ongoing')
 
-        self.assertEqual(len(data['players']), 2)
-        self.assertEqual(data['players'][0]['name'], "Alice")
-        self.assertEqual(data['players'][1]['name'], "Bob")
-        self.assertEqual(data['players'][0]['color'], "red")
-        self.assertEqual(data['players'][1]['color'], "blue")
-
-    def test_save_game_includes_board_state(self):
-        """Test that saved game includes board state with pieces."""
+    def test_save_game_after_move_content(self):
+        """Test that a saved game reflects moves made before saving."""
         game = Game("Alice", "Bob")
-        filepath = self.temp_path / "test_game.jungle"
-
-        FileManager.save_game(game, str(filepath))
-
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Should have 16 pieces (8 per player)
-        self.assertEqual(len(data['board_state']), 16)
-
-        # Check a specific piece (Red Rat at 8,0)
-        self.assertIn('8,0', data['board_state'])
-        rat_data = data['board_state']['8,0']
-        self.assertEqual(rat_data['piece'], 'Rat')
-        self.assertEqual(rat_data['owner'], 'red')
-        self.assertEqual(rat_data['rank'], 1)
-
-    def test_save_game_includes_current_player(self):
-        """Test that saved game includes current player index."""
-        game = Game("Alice", "Bob")
-        filepath = self.temp_path / "test_game.jungle"
-
-        FileManager.save_game(game, str(filepath))
-
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        self.assertEqual(data['current_player'], 0)
-
-    def test_save_game_includes_game_status(self):
-        """Test that saved game includes game status."""
-        game = Game("Alice", "Bob")
-        filepath = self.temp_path / "test_game.jungle"
-
-        FileManager.save_game(game, str(filepath))
+        game.make_move(Position(8, 0), Position(7, 0))  # Red Rat
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = self._save_and_parse(game)
 
-        self.assertEqual(data['game_status'], 'ongoing')
+        self.assertEqual(data['current_player'], 1)
+        self.assertEqual(len(data['move_history']), 1)
+        self.assertEqual(data['board_state'][8 * 7 + 0], 0)
+        self.assertEqual(data['board_state'][7 * 7 + 0], 1)
 
     def test_load_game_file_not_found(self):
         """Test that load_game raises exception for non-existent file."""
-        filepath = self.temp_path / "nonexistent.jungle"
+        filepath = self._temp_file('.jungle')
 
         with self.assertRaises(FileOperationException) as context:
             FileManager.load_game(str(filepath))
 
-        self.assertIn("File not found", str(context.exception))
+        self.assertIs(context.exception.code, FileOpError.NOT_FOUND)
 
     def test_load_game_invalid_extension(self):
         """Test that load_game raises exception for wrong file extension."""
-        filepath = self.temp_path / "test.txt"
-        filepath.write_text("test")
+        filepath = self._temp_file('.txt')
+        filepath.write_bytes(b"test")
 
         with self.assertRaises(FileOperationException) as context:
             FileManager.load_game(str(filepath))
 
-        self.assertIn("Invalid file extension", str(context.exception))
+        self.assertIs(context.exception.code, FileOpError.BAD_EXT)
 
     def test_load_game_invalid_json(self):
         """Test that load_game raises exception for invalid JSON."""
-        filepath = self.temp_path / "test.jungle"
-        filepath.write_text("not valid json")
+        filepath = self._temp_file('.jungle')
+        filepath.write_bytes(b"not valid json")
+
+        with self.assertRaises(FileOperationException) as context:
+            FileManager.load_game(str(filepath))
+
+        self.assertIs(context.exception.code, FileOpError.BAD_JSON)
+
+    def test_load_game_empty_file(self):
+        """Test that load_game raises exception for an empty file."""
+        filepath = self._temp_file('.jungle')
+        filepath.write_bytes(b"")
 
         with self.assertRaises(FileOperationException) as context:
             FileManager.load_game(str(filepath))
 
-        self.assertIn("Invalid JSON", str(context.exception))
+        self.assertIs(context.exception.code, FileOpError.BAD_JSON)
 
-    def test_load_game_restores_players(self):
-        """Test that load_game restores player information."""
+    def test_save_and_load_game_round_trip(self):
+        """Test that load_game restores a game written by save_game."""
         game = Game("Alice", "Bob")
-        filepath = self.temp_path / "test_game.jungle"
+        game.make_move(Position(8, 0), Position(7, 0))  # Red Rat
+        filepath = self._temp_file('.jungle')
 
         FileManager.save_game(game, str(filepath))
         loaded_game = FileManager.load_game(str(filepath))
 
+        self.assertEqual(loaded_game.players[0].name, "Alice")
+        self.assertEqual(loaded_game.current_player_index, 1)
+        self.assertIsNone(loaded_game.board.get_piece(Position(8, 0)))
+        self.assertEqual(loaded_game.board.get_piece(Position(7, 0)).rank, 1)
+        self.assertEqual(loaded_game.position_key, game.position_key)
+
+    def test_load_game_without_orjson_skips_mmap(self):
+        """Test that the stdlib json backend reads the file without mmap."""
+        game = Game("Alice", "Bob")
+        filepath = self._temp_file('.jungle')
+        FileManager.save_game(game, str(filepath))
+
+        with patch.object(file_manager, 'orjson', None), \
+                patch.object(file_manager, 'simplejson', None), \
+                patch.object(file_manager.mmap, 'mmap') as mock_mmap:
+            loaded_game = FileManager.load_game(str(filepath))
+
+        mock_mmap.assert_not_called()
+        self.assertEqual(loaded_game.position_key, game.position_key)
+
+    def test_save_overwrites_atomically(self):
+        """Test that saving over an existing file leaves no side files."""
+        game = Game("Alice", "Bob")
+        filepath = self._temp_file('.jungle')
+
+        # Save first time
+        FileManager.save_game(game, str(filepath))
+        first_content = filepath.read_bytes()
+
+        # Make a move and save again
+        game.make_move(Position(8, 0), Position(7, 0))
+        FileManager.save_game(game, str(filepath))
+
+        # No backup or temporary file is created
+        self.assertFalse(self._temp_file('.jungle.bak').exists())
+        self.assertFalse(self._temp_file('.jungle.tmp').exists())
+
+        # New file should be different
+        second_content = filepath.read_bytes()
+        self.assertNotEqual(first_content, second_content)
+
+    def test_failed_save_keeps_existing_file(self):
+        """Test that a failed overwrite leaves the previous save intact."""
+        game = Game("Alice", "Bob")
+        filepath = self._temp_file('.jungle')
+        FileManager.save_game(game, str(filepath))
+        original_content = filepath.read_bytes()
+
+        game.make_move(Position(8, 0), Position(7, 0))
+        with patch('controller.file_manager.os.replace', side_effect=OSError("disk full")):
+            with self.assertRaises(FileOperationException):
+                FileManager.save_game(game, str(filepath))
+
+        self.assertEqual(filepath.read_bytes(), original_content)
+        self.assertFalse(self._temp_file('.jungle.tmp').exists())
+
+
+class TestFileManagerSerialization(unittest.TestCase):
+    """Test cases for in-memory game serialization."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the unmodified starting game once; tests that move pieces build a fresh Game."""
+        cls._template_game = Game("Alice", "Bob")
+
+    def test_serialize_game_matches_saved_file(self):
+        """Test that serialize_game produces the bytes save_game writes."""
+        with tempfile.TemporaryDirectory(dir=TEMP_ROOT) as temp_dir:
+            filepath = Path(temp_dir) / "game.jungle"
+            FileManager.save_game(self._template_game, str(filepath))
+
+            self.assertEqual(
+                FileManager.serialize_game(self._template_game),
+                filepath.read_bytes()
+            )
+
+    def test_deserialize_game_restores_players(self):
+        """Test that deserialize_game restores player information."""
+        game = Game("Alice", "Bob")
+        loaded_game = FileManager.deserialize_game(FileManager.serialize_game(game))
+
         self.assertIsNotNone(loaded_game)
         self.assertEqual(len(loaded_game.players), 2)
         self.assertEqual(loaded_game.players[0].name, "Alice")
         self.assertEqual(loaded_game.players[1].name, "Bob")
 
-    def test_load_game_restores_board_state(self):
-        """Test that load_game restores board state with pieces."""
+    def test_deserialize_game_restores_board_state(self):
+        """Test that deserialize_game restores board state with pieces."""
         game = Game("Alice", "Bob")
-        filepath = self.temp_path / "test_game.jungle"
-
-        FileManager.save_game(game, str(filepath))
-        loaded_game = FileManager.load_game(str(filepath))
+        loaded_game = FileManager.deserialize_game(FileManager.serialize_game(game))
 
         # Check that pieces are restored
         rat_pos = Position(8, 0)
@@ -180,40 +283,90 @@ class TestFileManagerSaveLoad(unittest.TestCase):
         self.assertEqual(piece.rank, 1)
         self.assertEqual(piece.owner.name, "Alice")
 
-    def test_load_game_restores_current_player(self):
-        """Test that load_game restores current player."""
+    def test_deserialize_game_legacy_board_format(self):
+        """Test that deserialize_game still reads version 1.0 board dictionaries."""
+        legacy_data = {
+            'version': '1.0',
+            'players': [
+                {'name': 'Alice', 'color': 'red'},
+                {'name': 'Bob', 'color': 'blue'}
+            ],
+            'current_player': 1,
+            'board_state': {
+                '7,0': {'piece': 'Rat', 'owner': 'red', 'rank': 1},
+                '0,0': {'piece': 'Elephant', 'owner': 'blue', 'rank': 8}
+            },
+            'move_history': [],
+            'game_status': 'ongoing'
+        }
+        loaded_game = FileManager.deserialize_game(json.dumps(legacy_data).encode('utf-8'))
+
+        rat = loaded_game.board.get_piece(Position(7, 0))
+        self.assertEqual(rat.__class__.__name__, 'Rat')
+        self.assertEqual(rat.owner.name, "Alice")
+        self.assertEqual(loaded_game.board.get_piece(Position(0, 0)).rank, 8)
+        self.assertIsNone(loaded_game.board.get_piece(Position(8, 0)))
+        self.assertEqual(loaded_game.current_player_index, 1)
+
+    def test_deserialize_game_unknown_piece_type(self):
+        """Test that deserialize_game rejects unknown piece names."""
+        data = {
+            'version': '1.0',
+            'players': [
+                {'name': 'Alice', 'color': 'red'},
+                {'name': 'Bob', 'color': 'blue'}
+            ],
+            'current_player': 0,
+            'board_state': {'4,3': {'piece': 'Dragon', 'owner': 'red', 'rank': 9}},
+            'move_history': [],
+            'game_status': 'ongoing'
+        }
+
+        with self.assertRaises(FileOperationException) as context:
+            FileManager.deserialize_game(json.dumps(data).encode('utf-8'))
+
+        self.assertIn("Unknown piece type", str(context.exception))
+
+    def test_deserialize_game_invalid_piece_code(self):
+        """Test that deserialize_game rejects unknown or non-integer piece codes."""
+        data = _DECODER.decode(FileManager.serialize_game(self._template_game).decode('utf-8'))
+
+        for code in (17, -1, True, False, 1.0):
+            with self.subTest(code=code):
+                corrupted = dict(data, board_state=[code] + data['board_state'][1:])
+
+                with self.assertRaises(FileOperationException) as context:
+                    FileManager.deserialize_game(json.dumps(corrupted).encode('utf-8'))
+
+                self.assertIn("Unknown piece code", str(context.exception))
+
+    def test_deserialize_game_restores_current_player(self):
+        """Test that deserialize_game restores current player."""
         game = Game("Alice", "Bob")
         # Make a move to change current player
         game.make_move(Position(8, 0), Position(7, 0))
 
-        filepath = self.temp_path / "test_game.jungle"
-        FileManager.save_game(game, str(filepath))
-        loaded_game = FileManager.load_game(str(filepath))
+        loaded_game = FileManager.deserialize_game(FileManager.serialize_game(game))
 
         self.assertEqual(loaded_game.current_player_index, 1)
         self.assertEqual(loaded_game.get_current_player().name, "Bob")
 
-    def test_load_game_restores_game_status(self):
-        """Test that load_game restores game status."""
+    def test_deserialize_game_restores_game_status(self):
+        """Test that deserialize_game restores game status."""
         game = Game("Alice", "Bob")
-        filepath = self.temp_path / "test_game.jungle"
-
-        FileManager.save_game(game, str(filepath))
-        loaded_game = FileManager.load_game(str(filepath))
+        loaded_game = FileManager.deserialize_game(FileManager.serialize_game(game))
 
         self.assertEqual(loaded_game.game_status, GameStatus.ONGOING)
 
-    def test_save_and_load_after_moves(self):
-        """Test save and load after making several moves."""
+    def test_serialize_and_deserialize_after_moves(self):
+        """Test serialize and deserialize after making several moves."""
         game = Game("Alice", "Bob")
 
         # Make some moves
         game.make_move(Position(8, 0), Position(7, 0))  # Red Rat
         game.make_move(Position(0, 6), Position(1, 6))  # Blue Rat
 
-        filepath = self.temp_path / "test_game.jungle"
-        FileManager.save_game(game, str(filepath))
-        loaded_game = FileManager.load_game(str(filepath))
+        loaded_game = FileManager.deserialize_game(FileManager.serialize_game(game))
 
         # Verify pieces moved
         self.assertIsNone(loaded_game.board.get_piece(Position(8, 0)))
@@ -221,52 +374,79 @@ class TestFileManagerSaveLoad(unittest.TestCase):
         self.assertIsNone(loaded_game.board.get_piece(Position(0, 6)))
         self.assertIsNotNone(loaded_game.board.get_piece(Position(1, 6)))
 
-    def test_save_creates_backup(self):
-        """Test that saving over existing file creates backup."""
-        game = Game("Alice", "Bob")
-        filepath = self.temp_path / "test_game.jungle"
-
-        # Save first time
-        FileManager.save_game(game, str(filepath))
-        first_content = filepath.read_text()
-
-        # Make a move and save again
-        game.make_move(Position(8, 0), Position(7, 0))
-        FileManager.save_game(game, str(filepath))
-
-        # Backup should have been created and removed
-        backup_path = self.temp_path / "test_game.jungle.bak"
-        self.assertFalse(backup_path.exists())
-
-        # New file should be different
-        second_content = filepath.read_text()
-        self.assertNotEqual(first_content, second_content)
-
-
-if __name__ == '__main__':
-    unittest.main()
-
-
-
-class TestFileManagerRecord(unittest.TestCase):
+    def test_deserialize_game_invalid_json(self):
+        """Test that deserialize_game raises exception for invalid JSON."""
+        with self.assertRaises(FileOperationException) as context:
+            FileManager.deserialize_game(b"not valid json")
+
+        self.assertIs(context.exception.code, FileOpError.BAD_JSON)
+
+
+class TestFileManagerJsonBackend(unittest.TestCase):
+    """Test cases for JSON backend selection and REQUIRE_SPEEDUPS."""
+
+    @staticmethod
+    def _import_file_manager_copy(speedups, c_scanner=True, require=False):
+        """
+        Import a private copy of file_manager with orjson missing and a
+        stub simplejson installed.
+
+        Args:
+            speedups: Whether the stub simplejson has its _speedups extension
+            c_scanner: Whether the stdlib json C scanner is available
+            require: Whether REQUIRE_SPEEDUPS is set
+
+        Returns:
+            The freshly executed module
+        """
+        stub = types.ModuleType('simplejson')
+        if speedups:
+            stub._speedups = types.ModuleType('simplejson._speedups')
+        scanner = json.scanner.c_make_scanner if c_scanner else None
+        environ = {'REQUIRE_SPEEDUPS': '1' if require else ''}
+        spec = importlib.util.spec_from_file_location(
+            '_file_manager_copy', file_manager.__file__)
+        module = importlib.util.module_from_spec(spec)
+        with patch.dict(sys.modules, {'orjson': None, 'simplejson': stub}), \
+                patch.dict(os.environ, environ), \
+                patch.object(json.scanner, 'c_make_scanner', scanner):
+            sys.modules.pop('simplejson._speedups', None)
+            spec.loader.exec_module(module)
+        return module
+
+    def test_simplejson_with_speedups_is_chosen(self):
+        """Test simplejson is the backend when its C extension is present."""
+        module = self._import_file_manager_copy(speedups=True, require=True)
+        self.assertIsNotNone(module.simplejson)
+        self.assertTrue(module.JSON_SPEEDUPS)
+
+    def test_pure_python_simplejson_falls_back_to_stdlib(self):
+        """Test simplejson without _speedups is skipped for the stdlib json."""
+        module = self._import_file_manager_copy(speedups=False, require=True)
+        self.assertIsNone(module.simplejson)
+        self.assertTrue(module.JSON_SPEEDUPS)
+
+    def test_require_speedups_rejects_pure_python_backend(self):
+        """Test REQUIRE_SPEEDUPS refuses a chosen backend with no C path."""
+        with self.assertRaisesRegex(ImportError, 'REQUIRE_SPEEDUPS'):
+            self._import_file_manager_copy(
+                speedups=False, c_scanner=False, require=True)
+
+    def test_pure_python_backend_allowed_without_require(self):
+        """Test the pure-Python fallback loads when REQUIRE_SPEEDUPS is unset."""
+        module = self._import_file_manager_copy(speedups=False, c_scanner=False)
+        self.assertFalse(module.JSON_SPEEDUPS)
+
+
+class TestFileManagerRecord(FileManagerTestCase):
     """Test cases for FileManager record operations."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
-
-    def tearDown(self):
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_save_record_creates_file(self):
         """Test that save_record creates a .record file."""
         game = Game("Alice", "Bob")
         game.make_move(Position(8, 0), Position(7, 0))
 
-        filepath = self.temp_path / "test_game.record"
+        filepath = self._temp_file('.record')
         result = FileManager.save_record(game, str(filepath))
 
         self.assertTrue(result)
@@ -277,68 +457,54 @@ class TestFileManagerRecord(unittest.TestCase):
         game = Game("Alice", "Bob")
         game.make_move(Position(8, 0), Position(7, 0))
 
-        filepath = self.temp_path / "test_game"
+        filepath = self._temp_file()
         FileManager.save_record(game, str(filepath))
 
-        record_file = self.temp_path / "test_game.record"
+        record_file = self._temp_file('.record')
         self.assertTrue(record_file.exists())
 
-    def test_save_record_includes_header(self):
-        """Test that record file includes proper header."""
-        game = Game("Alice", "Bob")
-        game.make_move(Position(8, 0), Position(7, 0))
-
-        filepath = self.temp_path / "test_game.record"
-        FileManager.save_record(game, str(filepath))
-
-        content = filepath.read_text()
-        self.assertIn("JUNGLE_GAME_RECORD_V1.0", content)
-        self.assertIn("Players: Alice (Red), Bob (Blue)", content)
-        self.assertIn("Start Time:", content)
-
-    def test_save_record_includes_moves(self):
-        """Test that record file includes move history."""
+    def test_save_record_content(self):
+        """Test that a record file contains header, moves and result."""
         game = Game("Alice", "Bob")
         game.make_move(Position(8, 0), Position(7, 0))  # Red Rat
         game.make_move(Position(0, 6), Position(1, 6))  # Blue Rat
 
-        filepath = self.temp_path / "test_game.record"
+        filepath = self._temp_file('.record')
         FileManager.save_record(game, str(filepath))
 
         content = filepath.read_text()
-        self.assertIn("Move 1:", content)
-        self.assertIn("Move 2:", content)
-        self.assertIn("Rat", content)
 
-    def test_save_record_includes_game_result_ongoing(self):
-        """Test that record includes 'In Progress' for ongoing games."""
-        game = Game("Alice", "Bob")
-        game.make_move(Position(8, 0), Position(7, 0))
+        with self.subTest(aspect='header'):
+            self.assertIn("JUNGLE_GAME_RECORD_V1.0", content)
+            self.assertIn("Players: Alice (Red), Bob (Blue)", content)
+            self.assertIn("Start Time:", content)
 
-        filepath = self.temp_path / "test_game.record"
-        FileManager.save_record(game, str(filepath))
+        with self.subTest(aspect='moves'):
+            self.assertIn("Move 1:", content)
+            self.assertIn("Move 2:", content)
+            self.assertIn("Rat", content)
 
-        content = filepath.read_text()
-        self.assertIn("Game Result: In Progress", content)
+        with self.subTest(aspect='game_result'):
+            self.assertIn("Game Result: In Progress", content)
 
     def test_load_record_file_not_found(self):
         """Test that load_record raises exception for non-existent file."""
-        filepath = self.temp_path / "nonexistent.record"
+        filepath = self._temp_file('.record')
 
         with self.assertRaises(FileOperationException) as context:
             FileManager.load_record(str(filepath))
 
-        self.assertIn("File not found", str(context.exception))
+        self.assertIs(context.exception.code, FileOpError.NOT_FOUND)
 
     def test_load_record_invalid_extension(self):
         """Test that load_record raises exception for wrong file extension."""
-        filepath = self.temp_path / "test.txt"
-        filepath.write_text("test")
+        filepath = self._temp_file('.txt')
+        filepath.write_bytes(b"test")
 
         with self.assertRaises(FileOperationException) as context:
             FileManager.load_record(str(filepath))
 
-        self.assertIn("Invalid file extension", str(context.exception))
+        self.assertIs(context.exception.code, FileOpError.BAD_EXT)
 
     def test_load_record_returns_moves(self):
         """Test that load_record returns list of move dictionaries."""
@@ -346,7 +512,7 @@ class TestFileManagerRecord(unittest.TestCase):
         game.make_move(Position(8, 0), Position(7, 0))
         game.make_move(Position(0, 6), Position(1, 6))
 
-        filepath = self.temp_path / "test_game.record"
+        filepath = self._temp_file('.record')
         FileManager.save_record(game, str(filepath))
 
         moves = FileManager.load_record(str(filepath))
@@ -362,7 +528,7 @@ class TestFileManagerRecord(unittest.TestCase):
         game = Game("Alice", "Bob")
         game.make_move(Position(8, 0), Position(7, 0))
 
-        filepath = self.temp_path / "test_game.record"
+        filepath = self._temp_file('.record')
         FileManager.save_record(game, str(filepath))
 
         replayed_game = FileManager.replay_record(str(filepath))
@@ -375,7 +541,7 @@ class TestFileManagerRecord(unittest.TestCase):
         game = Game("Alice", "Bob")
         game.make_move(Position(8, 0), Position(7, 0))
 
-        filepath = self.temp_path / "test_game.record"
+        filepath = self._temp_file('.record')
         FileManager.save_record(game, str(filepath))
 
         replayed_game = FileManager.replay_record(str(filepath))
@@ -383,16 +549,9 @@ class TestFileManagerRecord(unittest.TestCase):
         self.assertEqual(replayed_game.players[0].name, "Alice")
         self.assertEqual(replayed_game.players[1].name, "Bob")
 
-    def test_replay_record_executes_moves(self):
-        """Test that replay_record executes all moves."""
-        game = Game("Alice", "Bob")
-        game.make_move(Position(8, 0), Position(7, 0))  # Red Rat
-        game.make_move(Position(0, 6), Position(1, 6))  # Blue Rat
-
-        filepath = self.temp_path / "test_game.record"
-        FileManager.save_record(game, str(filepath))
-
-        replayed_game = FileManager.replay_record(str(filepath))
+    def test_replay_moves_executes_moves(self):
+        """Test that replay_moves executes all moves."""
+        replayed_game = FileManager.replay_moves(OPENING_MOVES, "Alice", "Bob")
 
         # Verify pieces moved
         self.assertIsNone(replayed_game.board.get_piece(Position(8, 0)))
@@ -400,27 +559,28 @@ class TestFileManagerRecord(unittest.TestCase):
         self.assertIsNone(replayed_game.board.get_piece(Position(0, 6)))
         self.assertIsNotNone(replayed_game.board.get_piece(Position(1, 6)))
 
-    def test_replay_record_maintains_turn_order(self):
-        """Test that replay_record maintains correct turn order."""
-        game = Game("Alice", "Bob")
-        game.make_move(Position(8, 0), Position(7, 0))  # Red move
-        game.make_move(Position(0, 6), Position(1, 6))  # Blue move
-
-        filepath = self.temp_path / "test_game.record"
-        FileManager.save_record(game, str(filepath))
-
-        replayed_game = FileManager.replay_record(str(filepath))
+    def test_replay_moves_maintains_turn_order(self):
+        """Test that replay_moves maintains correct turn order."""
+        replayed_game = FileManager.replay_moves(OPENING_MOVES, "Alice", "Bob")
 
         # After 2 moves (Red, Blue), it should be Red's turn again
         self.assertEqual(replayed_game.current_player_index, 0)
         self.assertEqual(replayed_game.get_current_player().name, "Alice")
 
+    def test_replay_moves_invalid_move(self):
+        """Test that replay_moves raises exception for an illegal move."""
+        # Blue cannot move first
+        with self.assertRaises(FileOperationException) as context:
+            FileManager.replay_moves(OPENING_MOVES[1:])
+
+        self.assertIn("Failed to replay move 1", str(context.exception))
+
     def test_replay_record_with_custom_names(self):
         """Test that replay_record can use custom player names."""
         game = Game("Alice", "Bob")
         game.make_move(Position(8, 0), Position(7, 0))
 
-        filepath = self.temp_path / "test_game.record"
+        filepath = self._temp_file('.record')
         FileManager.save_record(game, str(filepath))
 
         replayed_game = FileManager.replay_record(
@@ -433,3 +593,5 @@ class TestFileManagerRecord(unittest.TestCase):
         self.assertEqual(replayed_game.players[1].name, "Diana")
 
 
+if __name__ == '__main__':
+    unittest.main()
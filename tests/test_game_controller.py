@@ -3,22 +3,62 @@ Unit tests for GameController class.
 """
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
-from io import StringIO
 
 from controller.game_controller import GameController
 from model.game import Game
 from model.position import Position
-from model.exceptions import GameOverException, FileOperationException
+from model.exceptions import FileOperationException
+
+
+class FakeFileManager:
+    """
+    FileManager stand-in that records each call as (method_name, args)
+    and returns a canned result or raises a canned error.
+    """
+
+    def __init__(self):
+        self.result = None
+        self.error = None
+        self.calls = []
+
+    def _respond(self, method_name, args):
+        self.calls.append((method_name, args))
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def save_game(self, game, filename):
+        return self._respond('save_game', (game, filename))
+
+    def load_game(self, filename):
+        return self._respond('load_game', (filename,))
+
+    def save_record(self, game, filename):
+        return self._respond('save_record', (game, filename))
+
+    def replay_record(self, filename):
+        return self._respond('replay_record', (filename,))
 
 
 class TestGameController(unittest.TestCase):
     """Test cases for GameController class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build one game that each test resets in place."""
+        cls._game = Game("TestPlayer1", "TestPlayer2")
+
     def setUp(self):
         """Set up test fixtures."""
+        self._game.reset()
         self.controller = GameController()
-        self.controller.game = Game("TestPlayer1", "TestPlayer2")
+        self.controller.game = self._game
+        self.file_manager = FakeFileManager()
+        self.controller.file_manager = self.file_manager
+
+    def assertFileCall(self, method_name, *args):
+        """Assert the fake FileManager received exactly one call, to method_name with args."""
+        self.assertEqual(self.file_manager.calls, [(method_name, args)])
 
     def test_initialization_without_game(self):
         """Test controller initialization without a game."""
@@ -73,63 +113,73 @@ class TestGameController(unittest.TestCase):
 
     def test_process_command_save(self):
         """Test processing a save command."""
-        with patch.object(self.controller.file_manager, 'save_game', return_value=True):
-            result = self.controller.process_command("save test.jungle")
-            self.assertTrue(result)
+        self.file_manager.result = True
+        result = self.controller.process_command("save test.jungle")
+        self.assertFileCall('save_game', self._game, 'test.jungle')
+        self.assertTrue(result)
 
     def test_process_command_save_shortcut(self):
         """Test processing save command with shortcut."""
-        with patch.object(self.controller.file_manager, 'save_game', return_value=True):
-            result = self.controller.process_command("s test.jungle")
-            self.assertTrue(result)
+        self.file_manager.result = True
+        result = self.controller.process_command("s test.jungle")
+        self.assertFileCall('save_game', self._game, 'test.jungle')
+        self.assertTrue(result)
 
     def test_process_command_save_no_filename(self):
         """Test save command without filename."""
         result = self.controller.process_command("save")
+        self.assertEqual(self.file_manager.calls, [])
         self.assertFalse(result)
 
     def test_process_command_load(self):
         """Test processing a load command."""
         mock_game = Game("LoadedPlayer1", "LoadedPlayer2")
-        with patch.object(self.controller.file_manager, 'load_game', return_value=mock_game):
-            result = self.controller.process_command("load test.jungle")
-            self.assertTrue(result)
-            self.assertEqual(self.controller.game, mock_game)
+        self.file_manager.result = mock_game
+        result = self.controller.process_command("load test.jungle")
+        self.assertFileCall('load_game', 'test.jungle')
+        self.assertTrue(result)
+        self.assertEqual(self.controller.game, mock_game)
 
     def test_process_command_load_shortcut(self):
         """Test processing load command with shortcut."""
         mock_game = Game("LoadedPlayer1", "LoadedPlayer2")
-        with patch.object(self.controller.file_manager, 'load_game', return_value=mock_game):
-            result = self.controller.process_command("l test.jungle")
-            self.assertTrue(result)
+        self.file_manager.result = mock_game
+        result = self.controller.process_command("l test.jungle")
+        self.assertFileCall('load_game', 'test.jungle')
+        self.assertTrue(result)
 
     def test_process_command_load_no_filename(self):
         """Test load command without filename."""
         result = self.controller.process_command("load")
+        self.assertEqual(self.file_manager.calls, [])
         self.assertFalse(result)
 
     def test_process_command_record(self):
         """Test processing a record command."""
-        with patch.object(self.controller.file_manager, 'save_record', return_value=True):
-            result = self.controller.process_command("record test.record")
-            self.assertTrue(result)
+        self.file_manager.result = True
+        result = self.controller.process_command("record test.record")
+        self.assertFileCall('save_record', self._game, 'test.record')
+        self.assertTrue(result)
 
     def test_process_command_record_no_filename(self):
         """Test record command without filename."""
         result = self.controller.process_command("record")
+        self.assertEqual(self.file_manager.calls, [])
         self.assertFalse(result)
 
     def test_process_command_replay(self):
         """Test processing a replay command."""
         mock_game = Game("ReplayPlayer1", "ReplayPlayer2")
-        with patch.object(self.controller.file_manager, 'replay_record', return_value=mock_game):
-            result = self.controller.process_command("replay test.record")
-            self.assertTrue(result)
-            self.assertEqual(self.controller.game, mock_game)
+        self.file_manager.result = mock_game
+        result = self.controller.process_command("replay test.record")
+        self.assertFileCall('replay_record', 'test.record')
+        self.assertTrue(result)
+        self.assertEqual(self.controller.game, mock_game)
 
     def test_process_command_replay_no_filename(self):
         """Test replay command without filename."""
         result = self.controller.process_command("replay")
+        self.assertEqual(self.file_manager.calls, [])
         self.assertFalse(result)
 
     def test_process_command_quit(self):
@@ -156,6 +206,24 @@ class TestGameController(unittest.TestCase):
         result = self.controller.process_command("h")
         self.assertTrue(result)
 
+    def test_process_command_less_common_aliases(self):
+        """Test the '?', 'rec', 'rep' and 'exit' command aliases."""
+        self.file_manager.result = self._game
+        cases = (
+            ("?", []),
+            ("rec test.record", [('save_record', (self._game, 'test.record'))]),
+            ("rep test.record", [('replay_record', ('test.record',))]),
+        )
+        for command, expected_calls in cases:
+            with self.subTest(command=command):
+                self.file_manager.calls.clear()
+                self.assertTrue(self.controller.process_command(command))
+                self.assertEqual(self.file_manager.calls, expected_calls)
+
+        self.controller.running = True
+        self.assertTrue(self.controller.process_command("exit"))
+        self.assertFalse(self.controller.running)
+
     def test_process_command_unknown(self):
         """Test processing an unknown command."""
         result = self.controller.process_command("unknown")
@@ -198,45 +266,49 @@ class TestGameController(unittest.TestCase):
 
     def test_handle_save_command_success(self):
         """Test successful save."""
-        with patch.object(self.controller.file_manager, 'save_game', return_value=True):
-            result = self.controller._handle_save_command(['save', 'test.jungle'])
-            self.assertTrue(result)
+        self.file_manager.result = True
+        result = self.controller._handle_save_command(['save', 'test.jungle'])
+        self.assertFileCall('save_game', self._game, 'test.jungle')
+        self.assertTrue(result)
 
     def test_handle_save_command_failure(self):
         """Test save failure."""
-        with patch.object(self.controller.file_manager, 'save_game',
-                          side_effect=FileOperationException("Save failed")):
-            result = self.controller._handle_save_command(['save', 'test.jungle'])
-            self.assertFalse(result)
+        self.file_manager.error = FileOperationException("Save failed")
+        result = self.controller._handle_save_command(['save', 'test.jungle'])
+        self.assertFileCall('save_game', self._game, 'test.jungle')
+        self.assertFalse(result)
 
     def test_handle_load_command_success(self):
         """Test successful load."""
         mock_game = Game("LoadedPlayer1", "LoadedPlayer2")
-        with patch.object(self.controller.file_manager, 'load_game', return_value=mock_game):
-            result = self.controller._handle_load_command(['load', 'test.jungle'])
-            self.assertTrue(result)
-            self.assertEqual(self.controller.game, mock_game)
+        self.file_manager.result = mock_game
+        result = self.controller._handle_load_command(['load', 'test.jungle'])
+        self.assertFileCall('load_game', 'test.jungle')
+        self.assertTrue(result)
+        self.assertEqual(self.controller.game, mock_game)
 
     def test_handle_load_command_failure(self):
         """Test load failure."""
-        with patch.object(self.controller.file_manager, 'load_game',
-                          side_effect=FileOperationException("Load failed")):
-            result = self.controller._handle_load_command(['load', 'test.jungle'])
-            self.assertFalse(result)
+        self.file_manager.error = FileOperationException("Load failed")
+        result = self.controller._handle_load_command(['load', 'test.jungle'])
+        self.assertFileCall('load_game', 'test.jungle')
+        self.assertFalse(result)
 
     def test_handle_record_command_success(self):
         """Test successful record save."""
-        with patch.object(self.controller.file_manager, 'save_record', return_value=True):
-            result = self.controller._handle_record_command(['record', 'test.record'])
-            self.assertTrue(result)
+        self.file_manager.result = True
+        result = self.controller._handle_record_command(['record', 'test.record'])
+        self.assertFileCall('save_record', self._game, 'test.record')
+        self.assertTrue(result)
 
     def test_handle_replay_command_success(self):
         """Test successful replay."""
         mock_game = Game("ReplayPlayer1", "ReplayPlayer2")
-        with patch.object(self.controller.file_manager, 'replay_record', return_value=mock_game):
-            result = self.controller._handle_replay_command(['replay', 'test.record'])
-            self.assertTrue(result)
-            self.assertEqual(self.controller.game, mock_game)
+        self.file_manager.result = mock_game
+        result = self.controller._handle_replay_command(['replay', 'test.record'])
+        self.assertFileCall('replay_record', 'test.record')
+        self.assertTrue(result)
+        self.assertEqual(self.controller.game, mock_game)
 
     def test_handle_quit_command_no_game(self):
         """Test quit with no game in progress."""
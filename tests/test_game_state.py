@@ -11,14 +11,32 @@ from model.enums import PlayerColor
 from model.piece import Cat, Dog, Rat
 
 
+# Shared board positions; Position is immutable so tests can reuse these
+POS_22 = Position(2, 2)
+POS_33 = Position(3, 3)
+POS_44 = Position(4, 4)
+POS_55 = Position(5, 5)
+
+
 class TestGameState(unittest.TestCase):
     """Test cases for GameState class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the players, pieces and one board that each test resets in place."""
+        cls.player1 = Player("Player 1", PlayerColor.RED)
+        cls.player2 = Player("Player 2", PlayerColor.BLUE)
+        cls.board = Board()
+        cls.cat = Cat(cls.player1, POS_33)
+        cls.dog = Dog(cls.player2, POS_44)
+        cls.rat = Rat(cls.player1, POS_55)
+
     def setUp(self):
         """Set up test fixtures."""
-        self.player1 = Player("Player 1", PlayerColor.RED)
-        self.player2 = Player("Player 2", PlayerColor.BLUE)
-        self.board = Board()
+        self.board.clear()
+        self.cat.position = POS_33
+        self.dog.position = POS_44
+        self.rat.position = POS_55
 
     def test_game_state_creation(self):
         """Test creating a game state with board state, player index, and move count."""
@@ -41,126 +59,84 @@ class TestGameState(unittest.TestCase):
         with self.assertRaises(AttributeError):
             game_state.move_count = 10
 
-    def test_board_state_property_returns_copy(self):
-        """Test that board_state property returns a copy."""
-        cat = Cat(self.player1, Position(3, 3))
-        board_state = {Position(3, 3): cat}
+    def test_board_state_property_is_read_only(self):
+        """Test that board_state is a shared read-only view with explicit copies."""
+        cat = self.cat
+        board_state = {POS_33: cat}
         game_state = GameState(board_state, 0, 0)
 
         state1 = game_state.board_state
         state2 = game_state.board_state
 
-        # Should be equal but not the same object
-        self.assertEqual(state1, state2)
-        self.assertIsNot(state1, state2)
+        # Repeated reads share one view that cannot be modified
+        self.assertIs(state1, state2)
+        with self.assertRaises(TypeError):
+            state1[POS_44] = cat
+
+        # copy() gives an independent dictionary
+        state_copy = state1.copy()
+        state_copy[POS_44] = cat
+        self.assertEqual(state1, {POS_33: cat})
+
+    # (shared pieces by attribute name and square, player index, move count)
+    CAPTURE_CASES = [
+        ((), 0, 0),
+        ((('cat', POS_33), ('dog', POS_44)), 1, 10),
+        ((('cat', POS_33), ('dog', POS_44), ('rat', POS_55)), 1, 15),
+    ]
+
+    def test_capture_and_restore_cases(self):
+        """Test capturing a board, clearing it, then restoring the captured state."""
+        for placements, player_index, move_count in self.CAPTURE_CASES:
+            with self.subTest(pieces=len(placements)):
+                self.board.clear()
+                expected = {pos: getattr(self, name) for name, pos in placements}
+                for pos, piece in expected.items():
+                    self.board.set_piece(pos, piece)
+
+                game_state = GameState.capture_from_board(self.board, player_index, move_count)
+
+                self.assertEqual(game_state.current_player_index, player_index)
+                self.assertEqual(game_state.move_count, move_count)
+                self.assertEqual(game_state.board_state, expected)
+
+                # Clear the board
+                self.board.clear()
+                self.assertTrue(self.board.is_empty())
+
+                # Restore state and verify only the captured pieces return
+                game_state.restore_to_board(self.board)
+                self.assertEqual(self.board.snapshot_pieces(), expected)
+
+    def test_capture_keeps_piece_references(self):
+        """Test that a captured state refers to the board's pieces, not copies."""
+        cat = self.cat
+        self.board.set_piece(POS_33, cat)
 
-    def test_capture_from_empty_board(self):
-        """Test capturing state from an empty board."""
         game_state = GameState.capture_from_board(self.board, 0, 0)
 
-        self.assertEqual(game_state.current_player_index, 0)
-        self.assertEqual(game_state.move_count, 0)
-        self.assertEqual(len(game_state.board_state), 0)
-
-    def test_capture_from_board_with_pieces(self):
-        """Test capturing state from a board with pieces."""
-        cat = Cat(self.player1, Position(3, 3))
-        dog = Dog(self.player2, Position(4, 4))
-
-        self.board.set_piece(Position(3, 3), cat)
-        self.board.set_piece(Position(4, 4), dog)
-
-        game_state = GameState.capture_from_board(self.board, 1, 10)
-
-        self.assertEqual(game_state.current_player_index, 1)
-        self.assertEqual(game_state.move_count, 10)
-        self.assertEqual(len(game_state.board_state), 2)
-        self.assertEqual(game_state.board_state[Position(3, 3)], cat)
-        self.assertEqual(game_state.board_state[Position(4, 4)], dog)
-
-    def test_restore_to_empty_board(self):
-        """Test restoring an empty state to a board."""
-        board_state = {}
-        game_state = GameState(board_state, 0, 0)
-
-        game_state.restore_to_board(self.board)
-
-        # Board should be empty
-        for row in range(Board.BOARD_HEIGHT):
-            for col in range(Board.BOARD_WIDTH):
-                self.assertIsNone(self.board.get_piece(Position(row, col)))
-
-    def test_restore_to_board_with_pieces(self):
-        """Test restoring a state with pieces to a board."""
-        cat = Cat(self.player1, Position(3, 3))
-        dog = Dog(self.player2, Position(4, 4))
-
-        board_state = {
-            Position(3, 3): cat,
-            Position(4, 4): dog
-        }
-        game_state = GameState(board_state, 0, 0)
-
-        game_state.restore_to_board(self.board)
-
-        # Check that pieces are restored
-        self.assertEqual(self.board.get_piece(Position(3, 3)), cat)
-        self.assertEqual(self.board.get_piece(Position(4, 4)), dog)
-
-        # Check that other positions are empty
-        self.assertIsNone(self.board.get_piece(Position(0, 0)))
-        self.assertIsNone(self.board.get_piece(Position(5, 5)))
+        self.assertIs(game_state.board_state[POS_33], cat)
 
     def test_restore_updates_piece_positions(self):
         """Test that restoring updates piece positions correctly."""
-        cat = Cat(self.player1, Position(2, 2))
+        cat = self.cat
+        cat.position = POS_22
 
-        board_state = {Position(3, 3): cat}
+        board_state = {POS_33: cat}
         game_state = GameState(board_state, 0, 0)
 
         game_state.restore_to_board(self.board)
 
         # Piece position should be updated to match the saved state
-        self.assertEqual(cat.position, Position(3, 3))
-        self.assertEqual(self.board.get_piece(Position(3, 3)), cat)
-
-    def test_capture_and_restore_round_trip(self):
-        """Test that capturing and restoring preserves the board state."""
-        cat = Cat(self.player1, Position(3, 3))
-        dog = Dog(self.player2, Position(4, 4))
-        rat = Rat(self.player1, Position(5, 5))
-
-        self.board.set_piece(Position(3, 3), cat)
-        self.board.set_piece(Position(4, 4), dog)
-        self.board.set_piece(Position(5, 5), rat)
-
-        # Capture state
-        game_state = GameState.capture_from_board(self.board, 1, 15)
-
-        # Clear board
-        self.board.set_piece(Position(3, 3), None)
-        self.board.set_piece(Position(4, 4), None)
-        self.board.set_piece(Position(5, 5), None)
-
-        # Verify board is empty
-        self.assertIsNone(self.board.get_piece(Position(3, 3)))
-        self.assertIsNone(self.board.get_piece(Position(4, 4)))
-        self.assertIsNone(self.board.get_piece(Position(5, 5)))
-
-        # Restore state
-        game_state.restore_to_board(self.board)
-
-        # Verify pieces are restored
-        self.assertEqual(self.board.get_piece(Position(3, 3)), cat)
-        self.assertEqual(self.board.get_piece(Position(4, 4)), dog)
-        self.assertEqual(self.board.get_piece(Position(5, 5)), rat)
+        self.assertEqual(cat.position, POS_33)
+        self.assertIs(self.board.get_piece(POS_33), cat)
 
     def test_game_state_equality(self):
         """Test game state equality comparison."""
-        cat = Cat(self.player1, Position(3, 3))
+        cat = self.cat
 
-        board_state1 = {Position(3, 3): cat}
-        board_state2 = {Position(3, 3): cat}
+        board_state1 = {POS_33: cat}
+        board_state2 = {POS_33: cat}
         board_state3 = {}
 
         state1 = GameState(board_state1, 0, 5)
@@ -181,10 +157,20 @@ class TestGameState(unittest.TestCase):
         # Different move count should not be equal
         self.assertNotEqual(state1, state5)
 
+    def test_equal_game_states_hash_equal(self):
+        """Test that equal states share a hash and collapse in a set."""
+        state1 = GameState({POS_33: self.cat}, 0, 5)
+        state2 = GameState({POS_33: self.cat}, 0, 5)
+        state3 = GameState({POS_44: self.cat}, 0, 5)
+
+        self.assertEqual(hash(state1), hash(state2))
+        self.assertEqual(len({state1, state2, state3}), 2)
+        self.assertNotEqual(state1, state3)
+
     def test_game_state_repr(self):
         """Test developer-friendly representation."""
-        cat = Cat(self.player1, Position(3, 3))
-        board_state = {Position(3, 3): cat}
+        cat = self.cat
+        board_state = {POS_33: cat}
         game_state = GameState(board_state, 1, 20)
 
         state_repr = repr(game_state)
@@ -196,37 +182,37 @@ class TestGameState(unittest.TestCase):
 
     def test_restore_clears_existing_pieces(self):
         """Test that restore clears existing pieces before restoring."""
-        cat = Cat(self.player1, Position(3, 3))
-        dog = Dog(self.player2, Position(4, 4))
-        rat = Rat(self.player1, Position(5, 5))
+        cat = self.cat
+        dog = self.dog
+        rat = self.rat
 
         # Set up initial board state
-        self.board.set_piece(Position(3, 3), cat)
-        self.board.set_piece(Position(4, 4), dog)
+        self.board.set_piece(POS_33, cat)
+        self.board.set_piece(POS_44, dog)
 
         # Create a state with only the rat
-        board_state = {Position(5, 5): rat}
+        board_state = {POS_55: rat}
         game_state = GameState(board_state, 0, 0)
 
         # Restore should clear cat and dog, and place only rat
         game_state.restore_to_board(self.board)
 
-        self.assertIsNone(self.board.get_piece(Position(3, 3)))
-        self.assertIsNone(self.board.get_piece(Position(4, 4)))
-        self.assertEqual(self.board.get_piece(Position(5, 5)), rat)
+        self.assertIsNone(self.board.get_piece(POS_33))
+        self.assertIsNone(self.board.get_piece(POS_44))
+        self.assertIs(self.board.get_piece(POS_55), rat)
 
     def test_multiple_captures_are_independent(self):
         """Test that multiple captures create independent states."""
-        cat = Cat(self.player1, Position(3, 3))
-        self.board.set_piece(Position(3, 3), cat)
+        cat = self.cat
+        self.board.set_piece(POS_33, cat)
 
         # Capture first state
         state1 = GameState.capture_from_board(self.board, 0, 5)
 
         # Move piece and capture second state
-        self.board.set_piece(Position(3, 3), None)
-        self.board.set_piece(Position(4, 4), cat)
-        cat.position = Position(4, 4)
+        self.board.set_piece(POS_33, None)
+        self.board.set_piece(POS_44, cat)
+        cat.position = POS_44
 
         state2 = GameState.capture_from_board(self.board, 1, 6)
 
@@ -234,8 +220,8 @@ class TestGameState(unittest.TestCase):
         self.assertNotEqual(state1, state2)
         self.assertEqual(len(state1.board_state), 1)
         self.assertEqual(len(state2.board_state), 1)
-        self.assertIn(Position(3, 3), state1.board_state)
-        self.assertIn(Position(4, 4), state2.board_state)
+        self.assertIn(POS_33, state1.board_state)
+        self.assertIn(POS_44, state2.board_state)
 
 
 if __name__ == '__main__':
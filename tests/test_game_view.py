@@ -5,18 +5,51 @@ Tests view formatting and display logic for various game states.
 
 import unittest
 from model.game import Game
+from model.enums import GameStatus
 from model.move import MoveResult
 from model.position import Position
 from view.game_view import GameView
-
-
-class TestGameView(unittest.TestCase):
+from tests.helpers import SubstringAssertions
+
+
+# Shared board positions; Position is immutable so tests can reuse these
+POS_00 = Position(0, 0)
+POS_02 = Position(0, 2)
+POS_03 = Position(0, 3)
+POS_04 = Position(0, 4)
+POS_06 = Position(0, 6)
+POS_10 = Position(1, 0)
+POS_12 = Position(1, 2)
+POS_13 = Position(1, 3)
+POS_14 = Position(1, 4)
+POS_16 = Position(1, 6)
+POS_70 = Position(7, 0)
+POS_72 = Position(7, 2)
+POS_74 = Position(7, 4)
+POS_76 = Position(7, 6)
+POS_80 = Position(8, 0)
+POS_82 = Position(8, 2)
+POS_84 = Position(8, 4)
+POS_86 = Position(8, 6)
+
+# GameView and its BoardRenderer hold no per-game state, so one view
+# serves every test in this module
+VIEW = GameView()
+
+
+class TestGameView(SubstringAssertions, unittest.TestCase):
     """Test cases for GameView class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build one game that each test resets in place."""
+        cls.view = VIEW
+        cls._game = Game("Alice", "Bob")
+
     def setUp(self):
         """Set up test fixtures."""
-        self.view = GameView()
-        self.game = Game("Alice", "Bob")
+        self._game.reset()
+        self.game = self._game
 
     def test_initialization(self):
         """Test GameView initializes with BoardRenderer."""
@@ -26,26 +59,18 @@ class TestGameView(unittest.TestCase):
         """Test displaying initial game state."""
         result = self.view.display_game_state(self.game)
 
-        # Check for game header
-        self.assertIn("JUNGLE GAME", result)
-
-        # Check for player information
-        self.assertIn("Alice", result)
-        self.assertIn("Bob", result)
-
-        # Check for current turn
-        self.assertIn("Current Turn", result)
-
-        # Check for board rendering
-        self.assertIn("|", result)  # Board borders
-
-        # Check for undo status
-        self.assertIn("Undo", result)
+        self.assertContainsAll(result, (
+            "JUNGLE GAME",             # game header
+            "Alice", "Bob",            # player information
+            "Current Turn",            # current turn
+            "|",                       # board borders
+            "Undo",                    # undo status
+        ))
 
     def test_display_game_state_with_moves(self):
         """Test displaying game state after moves have been made."""
         # Make a move
-        self.game.make_move(Position(8, 0), Position(7, 0))
+        self.game.make_move(POS_80, POS_70)
 
         result = self.view.display_game_state(self.game)
 
@@ -59,160 +84,93 @@ class TestGameView(unittest.TestCase):
         """Test formatting game status for ongoing game."""
         result = self.view._format_game_status(self.game)
 
-        # Check for players
-        self.assertIn("Alice", result)
-        self.assertIn("Bob", result)
+        self.assertContainsAll(result, (
+            "Alice", "Bob",            # players
+            "Current Turn",            # current turn
+            "Pieces Remaining", "8",   # each player starts with 8 pieces
+        ))
 
-        # Check for current turn
-        self.assertIn("Current Turn", result)
-
-        # Check for piece counts
-        self.assertIn("Pieces Remaining", result)
-        self.assertIn("8", result)  # Each player starts with 8 pieces
+    def _win_for_red(self):
+        """Put the red rat beside Blue's den, then move it in to end the game."""
+        board = self.game.board
+        rat = board.get_piece(POS_80)
+        board.set_piece(POS_80, None)
+        board.place_unchecked(POS_13, rat)
+        self.game.make_move(POS_13, POS_03)
 
+    def test_format_game_status_game_over(self):
+        """Test formatting game status once a player has won."""
+        self._win_for_red()
 
+        result = self.view._format_game_status(self.game)
 
-    def test_format_move_history_empty(self):
-        """Test formatting move history when no moves made."""
-        # Create a new game with no moves
-        result = self.view._format_move_history(self.game)
-
-        # Should show header but no moves
-        self.assertIn("Recent Moves", result)
-
-    def test_format_move_history_with_moves(self):
-        """Test formatting move history with moves."""
-        # Make several moves
-        self.game.make_move(Position(8, 0), Position(7, 0))  # Red rat up
-        self.game.make_move(Position(0, 6), Position(1, 6))  # Blue rat down
-        self.game.make_move(Position(8, 2), Position(7, 2))  # Red leopard up
-
-        result = self.view._format_move_history(self.game)
+        self.assertContainsAll(result, ("Game Over - Winner", "Alice"))
+        self.assertNotIn("Current Turn", result)
 
-        # Check for move history header
-        self.assertIn("Recent Moves", result)
+    def test_format_game_status_draw(self):
+        """Test formatting game status for a drawn game."""
+        self.game._game_status = GameStatus.DRAW
 
-        # Check for move numbers
-        self.assertIn("1.", result)
-        self.assertIn("2.", result)
-        self.assertIn("3.", result)
+        result = self.view._format_game_status(self.game)
 
-        # Check for player names
-        self.assertIn("Alice", result)
-        self.assertIn("Bob", result)
+        self.assertIn("Game Over - Draw", result)
 
-    def test_format_move_history_max_recent_moves(self):
-        """Test that move history limits display to recent moves."""
-        # Make more than 5 moves
-        moves = [
-            (Position(8, 0), Position(7, 0)),  # 1. Red rat up
-            (Position(0, 6), Position(1, 6)),  # 2. Blue rat down
-            (Position(8, 2), Position(7, 2)),  # 3. Red leopard up
-            (Position(0, 4), Position(1, 4)),  # 4. Blue leopard down
-            (Position(8, 4), Position(7, 4)),  # 5. Red wolf up
-            (Position(0, 2), Position(1, 2)),  # 6. Blue wolf down
-            (Position(8, 6), Position(7, 6)),  # 7. Red elephant up
-        ]
-
-        for from_pos, to_pos in moves:
-            self.game.make_move(from_pos, to_pos)
-
-        result = self.view._format_move_history(self.game, max_recent_moves=5)
+    def test_display_game_over(self):
+        """Test displaying the full game state after the winning move."""
+        self._win_for_red()
 
-        # Should show only last 5 moves (3-7)
-        self.assertIn("3.", result)
-        self.assertIn("7.", result)
+        result = self.view.display_game_state(self.game)
 
-        # Should indicate earlier moves exist
-        self.assertIn("earlier moves", result)
+        self.assertContainsAll(result, ("Game Over - Winner: Alice", "Recent Moves", "1."))
 
     def test_display_welcome_message(self):
         """Test welcome message display."""
         result = self.view.display_welcome_message()
 
-        # Check for welcome header
-        self.assertIn("WELCOME TO JUNGLE GAME", result)
-
-        # Check for game description
-        self.assertIn("strategic", result)
-
-        # Check for terrain legend
-        self.assertIn("Terrain Legend", result)
-        self.assertIn("Land", result)
-        self.assertIn("Water", result)
-
-        # Check for commands
-        self.assertIn("Commands", result)
-        self.assertIn("move", result)
-        self.assertIn("undo", result)
-        self.assertIn("save", result)
-
-
-
-    def test_display_move_result_success(self):
-        """Test displaying successful move result."""
-        result = MoveResult(True, "Rat moved from (8,0) to (7,0)")
-        display = self.view.display_move_result(result)
-
-        self.assertIn("✓", display)
-        self.assertIn("Rat moved", display)
-
-    def test_display_move_result_failure(self):
-        """Test displaying failed move result."""
-        result = MoveResult(False, "Invalid move")
-        display = self.view.display_move_result(result)
-
-        self.assertIn("✗", display)
-        self.assertIn("Invalid move", display)
-
-    def test_display_error(self):
-        """Test error message display."""
-        result = self.view.display_error("Something went wrong")
-
-        self.assertIn("ERROR", result)
-        self.assertIn("Something went wrong", result)
-
-    def test_display_info(self):
-        """Test info message display."""
-        result = self.view.display_info("Game saved successfully")
-
-        self.assertIn("INFO", result)
-        self.assertIn("Game saved successfully", result)
-
-    def test_display_undo_result_success(self):
-        """Test displaying successful undo result."""
-        result = self.view.display_undo_result(True)
-
-        self.assertIn("✓", result)
-        self.assertIn("undone successfully", result)
-
-    def test_display_undo_result_failure(self):
-        """Test displaying failed undo result."""
-        result = self.view.display_undo_result(False)
-
-        self.assertIn("✗", result)
-        self.assertIn("No moves to undo", result)
+        self.assertContainsAll(result, (
+            "WELCOME TO JUNGLE GAME",              # welcome header
+            "strategic",                           # game description
+            "Terrain Legend", "Land", "Water",     # terrain legend
+            "Commands", "move", "undo", "save",    # commands
+        ))
+
+    # (display method, arguments, substrings the output must contain)
+    MESSAGE_CASES = [
+        ("display_move_result", (MoveResult(True, "Rat moved from (8,0) to (7,0)"),),
+         ("✓", "Rat moved")),
+        ("display_move_result", (MoveResult(False, "Invalid move"),),
+         ("✗", "Invalid move")),
+        ("display_error", ("Something went wrong",), ("ERROR", "Something went wrong")),
+        ("display_info", ("Game saved successfully",), ("INFO", "Game saved successfully")),
+        ("display_undo_result", (True,), ("✓", "undone successfully")),
+        ("display_undo_result", (False,), ("✗", "No moves to undo")),
+    ]
+
+    def test_display_messages(self):
+        """Test move, undo, error and info messages show their marker and text."""
+        for method_name, args, expected in self.MESSAGE_CASES:
+            with self.subTest(method=method_name, args=args):
+                display = getattr(self.view, method_name)(*args)
+                self.assertContainsAll(display, expected)
 
     def test_display_game_state_shows_piece_counts(self):
         """Test that game state display shows piece counts."""
         result = self.view.display_game_state(self.game)
 
         # Should show piece counts for both players
-        self.assertIn("Pieces Remaining", result)
-        self.assertIn("Alice=8", result)
-        self.assertIn("Bob=8", result)
+        self.assertContainsAll(result, ("Pieces Remaining", "Alice=8", "Bob=8"))
 
     def test_display_game_state_after_capture(self):
         """Test game state display after a piece is captured."""
         # Set up a capture scenario
         # Move red rat to capture blue rat
-        self.game.board.set_piece(Position(0, 6), None)  # Remove blue rat
-        self.game.board.set_piece(Position(1, 6), self.game.board.get_piece(Position(0, 6)))
+        self.game.board.set_piece(POS_06, None)  # Remove blue rat
+        self.game.board.set_piece(POS_16, self.game.board.get_piece(POS_06))
 
         # Move red rat up and capture
-        self.game.make_move(Position(8, 0), Position(7, 0))
-        self.game.make_move(Position(0, 0), Position(1, 0))  # Blue elephant
-        self.game.make_move(Position(7, 0), Position(8, 0))
+        self.game.make_move(POS_80, POS_70)
+        self.game.make_move(POS_00, POS_10)  # Blue elephant
+        self.game.make_move(POS_70, POS_80)
 
         result = self.view.display_game_state(self.game)
 
@@ -222,7 +180,7 @@ class TestGameView(unittest.TestCase):
     def test_display_game_state_undo_available(self):
         """Test that game state shows undo availability."""
         # Make a move
-        self.game.make_move(Position(8, 0), Position(7, 0))
+        self.game.make_move(POS_80, POS_70)
 
         result = self.view.display_game_state(self.game)
 
@@ -238,16 +196,79 @@ class TestGameView(unittest.TestCase):
         self.assertIn("Undo not available", result)
 
     def test_game_view_returns_strings(self):
-        """Test that all display methods return strings."""
-        # Test all display methods return strings
-        self.assertIsInstance(self.view.display_game_state(self.game), str)
-        self.assertIsInstance(self.view.display_welcome_message(), str)
-        self.assertIsInstance(self.view.display_error("test"), str)
-        self.assertIsInstance(self.view.display_info("test"), str)
-        self.assertIsInstance(self.view.display_undo_result(True), str)
-
-        result = MoveResult(True, "test")
-        self.assertIsInstance(self.view.display_move_result(result), str)
+        """Test that the message display methods return strings."""
+        # display_game_state is covered by the display_game_state_* tests
+        calls = (
+            (self.view.display_welcome_message, ()),
+            (self.view.display_error, ("test",)),
+            (self.view.display_info, ("test",)),
+            (self.view.display_undo_result, (True,)),
+            (self.view.display_move_result, (MoveResult(True, "test"),)),
+        )
+
+        for method, args in calls:
+            with self.subTest(method=method.__name__):
+                self.assertIsInstance(method(*args), str)
+
+
+class TestGameViewMoveHistory(SubstringAssertions, unittest.TestCase):
+    """Test cases for move history formatting."""
+
+    # Seven opening moves, alternating Red and Blue
+    MOVES = (
+        (POS_80, POS_70),  # 1. Red rat up
+        (POS_06, POS_16),  # 2. Blue rat down
+        (POS_82, POS_72),  # 3. Red leopard up
+        (POS_04, POS_14),  # 4. Blue leopard down
+        (POS_84, POS_74),  # 5. Red wolf up
+        (POS_02, POS_12),  # 6. Blue wolf down
+        (POS_86, POS_76),  # 7. Red elephant up
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        """Play the moves once and keep the resulting history."""
+        cls.view = VIEW
+        cls.game = Game("Alice", "Bob")
+        for from_pos, to_pos in cls.MOVES:
+            cls.game.make_move(from_pos, to_pos)
+        cls._history = cls.game.move_history
+
+    def _history_after(self, move_count):
+        """Trim the shared game's history to its first move_count moves."""
+        self.game._move_history[:] = self._history[:move_count]
+        return self.view._format_move_history(self.game)
+
+    def test_format_move_history_empty(self):
+        """Test formatting move history when no moves made."""
+        result = self._history_after(0)
+
+        # Should show header but no moves
+        self.assertIn("Recent Moves", result)
+        self.assertNotIn("1.", result)
+
+    def test_format_move_history_with_moves(self):
+        """Test formatting move history with moves."""
+        result = self._history_after(3)
+
+        self.assertContainsAll(result, (
+            "Recent Moves",            # move history header
+            "1.", "2.", "3.",          # move numbers
+            "Alice", "Bob",            # player names
+        ))
+
+    def test_format_move_history_max_recent_moves(self):
+        """Test that move history limits display to recent moves."""
+        # The formatter shows at most 5 moves by default
+        result = self._history_after(7)
+
+        # Should show only last 5 moves (3-7)
+        self.assertIn("3.", result)
+        self.assertIn("7.", result)
+        self.assertNotIn("\n2.", result)
+
+        # Should indicate earlier moves exist
+        self.assertIn("earlier moves", result)
 
 
 if __name__ == '__main__':
@@ -3,6 +3,7 @@ Integration tests for complete game scenarios.
 Tests end-to-end game flows, save/load/record functionality, and complex move sequences.
 """
 
+import shutil
 import unittest
 import tempfile
 from pathlib import Path
@@ -10,33 +11,71 @@ from pathlib import Path
 from model.game import Game
 from model.position import Position
 from controller.file_manager import FileManager
+from tests.helpers import TEMP_ROOT
+
+
+# Shared board positions; Position is immutable so tests can reuse these
+POS_06 = Position(0, 6)
+POS_11 = Position(1, 1)
+POS_12 = Position(1, 2)
+POS_13 = Position(1, 3)
+POS_16 = Position(1, 6)
+POS_20 = Position(2, 0)
+POS_30 = Position(3, 0)
+POS_40 = Position(4, 0)
+POS_50 = Position(5, 0)
+POS_60 = Position(6, 0)
+POS_70 = Position(7, 0)
+POS_73 = Position(7, 3)
+POS_74 = Position(7, 4)
+POS_75 = Position(7, 5)
+POS_76 = Position(7, 6)
+POS_80 = Position(8, 0)
+POS_86 = Position(8, 6)
+
+
+def _board_fingerprint(board):
+    """Map each occupied position to its piece type name, for board comparisons."""
+    return {pos: type(piece).__name__ for pos, piece in board.snapshot_pieces().items()}
+
+
+class TempDirTestCase(unittest.TestCase):
+    """Shared scratch directory and opening game for integration tests that write files."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the class's scratch directory and play the opening once."""
+        cls.temp_dir = tempfile.mkdtemp(dir=TEMP_ROOT)
+        cls.temp_path = Path(cls.temp_dir)
+
+        # Red rat up, Blue rat down; tests only save this game, never move it
+        cls.opened_game = Game("Alice", "Bob")
+        cls.opened_game.make_move(POS_80, POS_70)
+        cls.opened_game.make_move(POS_06, POS_16)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up temporary files."""
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
 
+    def _temp_file(self, name: str) -> Path:
+        """Return a scratch file path unique to the running test."""
+        return self.temp_path / f"{self._testMethodName}_{name}"
 
 
-
-class TestSaveLoadIntegration(unittest.TestCase):
+class TestSaveLoadIntegration(TempDirTestCase):
     """Test save/load functionality integration."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
-
-    def tearDown(self):
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_save_load_mid_game(self):
         """Test saving and loading a game in progress."""
         # Create game and make several moves
         game = Game("Alice", "Bob")
-        game.make_move(Position(8, 0), Position(7, 0))
-        game.make_move(Position(0, 6), Position(1, 6))
-        game.make_move(Position(8, 6), Position(7, 6))
+        game.make_move(POS_80, POS_70)
+        game.make_move(POS_06, POS_16)
+        game.make_move(POS_86, POS_76)
 
         # Save game
-        filepath = self.temp_path / "test_save.jungle"
+        filepath = self._temp_file("test_save.jungle")
         FileManager.save_game(game, str(filepath))
 
         # Load game
@@ -48,147 +87,132 @@ class TestSaveLoadIntegration(unittest.TestCase):
         self.assertEqual(loaded_game.players[1].name, "Bob")
 
         # Verify board state matches
-        for row in range(9):
-            for col in range(7):
-                pos = Position(row, col)
-                original_piece = game.board.get_piece(pos)
-                loaded_piece = loaded_game.board.get_piece(pos)
-
-                if original_piece is None:
-                    self.assertIsNone(loaded_piece)
-                else:
-                    self.assertIsNotNone(loaded_piece)
-                    self.assertEqual(
-                        original_piece.__class__.__name__,
-                        loaded_piece.__class__.__name__
-                    )
+        self.assertEqual(_board_fingerprint(loaded_game.board), _board_fingerprint(game.board))
 
     def test_save_load_continue_playing(self):
         """Test that loaded game can continue playing."""
-        # Create game and make moves
-        game = Game("Alice", "Bob")
-        game.make_move(Position(8, 0), Position(7, 0))
-        game.make_move(Position(0, 6), Position(1, 6))
+        game = self.opened_game
 
         # Save and load
-        filepath = self.temp_path / "continue_game.jungle"
+        filepath = self._temp_file("continue_game.jungle")
         FileManager.save_game(game, str(filepath))
         loaded_game = FileManager.load_game(str(filepath))
 
         # Continue playing
-        result = loaded_game.make_move(Position(8, 6), Position(7, 6))
+        result = loaded_game.make_move(POS_86, POS_76)
         self.assertTrue(result.success)
 
         # Verify piece moved
-        self.assertIsNone(loaded_game.board.get_piece(Position(8, 6)))
-        self.assertIsNotNone(loaded_game.board.get_piece(Position(7, 6)))
+        self.assertIsNone(loaded_game.board.get_piece(POS_86))
+        self.assertIsNotNone(loaded_game.board.get_piece(POS_76))
 
 
-class TestRecordIntegration(unittest.TestCase):
+class TestRecordIntegration(TempDirTestCase):
     """Test record functionality integration."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
+    def test_load_record_lists_moves_in_order(self):
+        """Test that a saved record lists the opening moves in play order."""
+        record_path = self._temp_file("opening.record")
+        FileManager.save_record(self.opened_game, str(record_path))
 
-    def tearDown(self):
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        moves = FileManager.load_record(str(record_path))
 
+        self.assertEqual(
+            [(m['from_row'], m['from_col'], m['to_row'], m['to_col']) for m in moves],
+            [(8, 0, 7, 0), (0, 6, 1, 6)]
+        )
 
+    def test_record_replay_round_trip(self):
+        """Test that replaying a saved record reaches the recorded position."""
+        game = self.opened_game
+        record_path = self._temp_file("opening.record")
+        FileManager.save_record(game, str(record_path))
 
+        replayed_game = FileManager.replay_record(str(record_path))
 
+        self.assertEqual(replayed_game.players[0].name, "Alice")
+        self.assertEqual(replayed_game.players[1].name, "Bob")
+        self.assertEqual(replayed_game.current_player_index, game.current_player_index)
+        self.assertEqual(_board_fingerprint(replayed_game.board), _board_fingerprint(game.board))
+        self.assertEqual(replayed_game.position_key, game.position_key)
 
 
 class TestComplexMoveSequences(unittest.TestCase):
     """Test complex move sequences and edge cases."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build one game that each test resets in place."""
+        cls._game = Game()
 
-
-
+    def setUp(self):
+        """Set up test fixtures."""
+        self._game.reset()
+        self.game = self._game
 
     def test_trap_capture_sequence(self):
         """Test capturing pieces in traps."""
-        game = Game()
-
         # Simple test: verify trap detection and piece movement into traps
-        game.make_move(Position(7, 5), Position(7, 4))  # Red cat left (into red trap at 7,4)
-        self.assertTrue(game.board.is_trap(Position(7, 4), game.players[0]))  # Red trap
-        self.assertIsNotNone(game.board.get_piece(Position(7, 4)))  # Cat is in trap
+        self.game.make_move(POS_75, POS_74)  # Red cat left (into red trap at 7,4)
+        self.assertTrue(self.game.board.is_trap(POS_74, self.game.players[0]))  # Red trap
+        self.assertIsNotNone(self.game.board.get_piece(POS_74))  # Cat is in trap
 
-        game.make_move(Position(1, 1), Position(1, 2))  # Blue cat right (into blue trap at 1,2)
-        self.assertTrue(game.board.is_trap(Position(1, 2), game.players[1]))  # Blue trap
-        self.assertIsNotNone(game.board.get_piece(Position(1, 2)))  # Cat is in trap
+        self.game.make_move(POS_11, POS_12)  # Blue cat right (into blue trap at 1,2)
+        self.assertTrue(self.game.board.is_trap(POS_12, self.game.players[1]))  # Blue trap
+        self.assertIsNotNone(self.game.board.get_piece(POS_12))  # Cat is in trap
 
         # Move pieces out of traps
-        game.make_move(Position(7, 4), Position(7, 3))  # Red cat left (out of trap)
-        self.assertIsNone(game.board.get_piece(Position(7, 4)))
+        self.game.make_move(POS_74, POS_73)  # Red cat left (out of trap)
+        self.assertIsNone(self.game.board.get_piece(POS_74))
 
-        game.make_move(Position(1, 2), Position(1, 3))  # Blue cat right (out of trap)
-        self.assertIsNone(game.board.get_piece(Position(1, 2)))
+        self.game.make_move(POS_12, POS_13)  # Blue cat right (out of trap)
+        self.assertIsNone(self.game.board.get_piece(POS_12))
 
     def test_multiple_undo_sequence(self):
         """Test multiple undo operations."""
-        game = Game()
-
         # Make several moves along clear paths
-        game.make_move(Position(6, 0), Position(5, 0))  # Red lion up
-        game.make_move(Position(2, 0), Position(3, 0))  # Blue tiger down
-        game.make_move(Position(5, 0), Position(4, 0))  # Red lion up
+        self.game.make_move(POS_60, POS_50)  # Red lion up
+        self.game.make_move(POS_20, POS_30)  # Blue tiger down
+        self.game.make_move(POS_50, POS_40)  # Red lion up
 
         # Undo moves
-        self.assertTrue(game.can_undo())
-        game.undo_move()
-        self.assertIsNotNone(game.board.get_piece(Position(5, 0)))
-        self.assertIsNone(game.board.get_piece(Position(4, 0)))
+        self.assertTrue(self.game.can_undo())
+        self.game.undo_move()
+        self.assertIsNotNone(self.game.board.get_piece(POS_50))
+        self.assertIsNone(self.game.board.get_piece(POS_40))
 
-        game.undo_move()
-        self.assertIsNone(game.board.get_piece(Position(3, 0)))
-        self.assertIsNotNone(game.board.get_piece(Position(2, 0)))
+        self.game.undo_move()
+        self.assertIsNone(self.game.board.get_piece(POS_30))
+        self.assertIsNotNone(self.game.board.get_piece(POS_20))
 
-        game.undo_move()
-        self.assertIsNone(game.board.get_piece(Position(5, 0)))
-        self.assertIsNotNone(game.board.get_piece(Position(6, 0)))
+        self.game.undo_move()
+        self.assertIsNone(self.game.board.get_piece(POS_50))
+        self.assertIsNotNone(self.game.board.get_piece(POS_60))
 
         # No more undos available
-        self.assertFalse(game.can_undo())
+        self.assertFalse(self.game.can_undo())
 
 
-class TestSaveLoadRecordCombination(unittest.TestCase):
+class TestSaveLoadRecordCombination(TempDirTestCase):
     """Test combinations of save, load, and record operations."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
-
-    def tearDown(self):
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_save_load_then_record(self):
         """Test saving, loading, then creating a record."""
-        # Create game and make moves
-        game = Game("Alice", "Bob")
-        game.make_move(Position(8, 0), Position(7, 0))
-        game.make_move(Position(0, 6), Position(1, 6))
+        game = self.opened_game
 
         # Save game
-        save_path = self.temp_path / "game.jungle"
+        save_path = self._temp_file("game.jungle")
         FileManager.save_game(game, str(save_path))
 
         # Load game
         loaded_game = FileManager.load_game(str(save_path))
 
         # Continue playing
-        loaded_game.make_move(Position(6, 0), Position(5, 0))  # Red lion up
-        loaded_game.make_move(Position(2, 0), Position(3, 0))  # Blue tiger down
+        loaded_game.make_move(POS_60, POS_50)  # Red lion up
+        loaded_game.make_move(POS_20, POS_30)  # Blue tiger down
 
         # Create record
-        record_path = self.temp_path / "game.record"
+        record_path = self._temp_file("game.record")
         FileManager.save_record(loaded_game, str(record_path))
 
         # Verify record was created
@@ -196,23 +220,20 @@ class TestSaveLoadRecordCombination(unittest.TestCase):
 
     def test_replay_then_save(self):
         """Test replaying a record then saving the game."""
-        # Create original game
-        game = Game("Player1", "Player2")
-        game.make_move(Position(8, 0), Position(7, 0))
-        game.make_move(Position(0, 6), Position(1, 6))
+        game = self.opened_game
 
         # Save record
-        record_path = self.temp_path / "original.record"
+        record_path = self._temp_file("original.record")
         FileManager.save_record(game, str(record_path))
 
         # Replay record
         replayed_game = FileManager.replay_record(str(record_path))
 
         # Continue playing
-        replayed_game.make_move(Position(6, 0), Position(5, 0))  # Red lion up
+        replayed_game.make_move(POS_60, POS_50)  # Red lion up
 
         # Save the replayed game
-        save_path = self.temp_path / "replayed.jungle"
+        save_path = self._temp_file("replayed.jungle")
         result = FileManager.save_game(replayed_game, str(save_path))
 
         self.assertTrue(result)
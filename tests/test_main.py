@@ -20,20 +20,26 @@ from model.game import Game
 from model.position import Position
 from controller.game_controller import GameController
 from controller.file_manager import FileManager
+from tests.helpers import TEMP_ROOT
+
+
+# Shared board positions; Position is immutable so tests can reuse these
+POS_50 = Position(5, 0)
+POS_60 = Position(6, 0)
 
 
 class TestMainApplication(unittest.TestCase):
     """Test cases for main application entry point."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Create one scratch directory for the class."""
+        cls.temp_dir = tempfile.mkdtemp(dir=TEMP_ROOT)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures."""
-        # Clean up temp directory
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
 
     def test_parse_arguments_default(self):
         """Test parsing arguments with no options."""
@@ -156,14 +162,15 @@ class TestMainApplication(unittest.TestCase):
 class TestApplicationIntegration(unittest.TestCase):
     """Integration tests for complete application flow."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Create one scratch directory for the class."""
+        cls.temp_dir = tempfile.mkdtemp(dir=TEMP_ROOT)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
 
     @patch('builtins.input')
     @patch('builtins.print')
@@ -205,7 +212,7 @@ class TestApplicationIntegration(unittest.TestCase):
 
         # Create and save a game
         game = Game("Alice", "Bob")
-        game.make_move(Position(6, 0), Position(5, 0))  # Make a move
+        game.make_move(POS_60, POS_50)  # Make a move
 
         file_manager = FileManager()
         success = file_manager.save_game(game, save_file)
@@ -219,8 +226,8 @@ class TestApplicationIntegration(unittest.TestCase):
         self.assertEqual(loaded_game.players[0].name, "Alice")
         self.assertEqual(loaded_game.players[1].name, "Bob")
         # Verify the board state was restored (piece moved from 6,0 to 5,0)
-        self.assertIsNone(loaded_game.board.get_piece(Position(6, 0)))
-        self.assertIsNotNone(loaded_game.board.get_piece(Position(5, 0)))
+        self.assertIsNone(loaded_game.board.get_piece(POS_60))
+        self.assertIsNotNone(loaded_game.board.get_piece(POS_50))
 
     @patch('builtins.input')
     @patch('builtins.print')
@@ -226,9 +226,15 @@ class TestMove(unittest.TestCase):
 class TestMoveSerializationIntegration(unittest.TestCase):
     """Integration tests for move serialization with Game."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build one game that each test resets in place."""
+        cls._game = Game("Player 1", "Player 2")
+
     def setUp(self):
         """Set up a game for integration testing."""
-        self.game = Game("Player 1", "Player 2")
+        self._game.reset()
+        self.game = self._game
 
     def test_serialize_and_deserialize_move(self):
         """Test full serialization and deserialization cycle."""
@@ -80,6 +80,15 @@ class TestPieceBase(unittest.TestCase):
         piece.position = pos2
         self.assertEqual(piece.position, pos2)
     
+    def test_concrete_pieces_have_no_instance_dict(self):
+        """Test that every concrete piece class keeps __slots__ storage."""
+        from model.piece import Rat, Cat, Dog, Wolf, Leopard, Tiger, Lion, Elephant
+        
+        for piece_class in (Rat, Cat, Dog, Wolf, Leopard, Tiger, Lion, Elephant):
+            with self.subTest(piece=piece_class.__name__):
+                piece = piece_class(self.player1, Position(3, 3))
+                self.assertFalse(hasattr(piece, '__dict__'))
+    
     def test_abstract_methods_must_be_implemented(self):
         """Test that Piece cannot be instantiated without implementing abstract methods."""
         with self.assertRaises(TypeError):
@@ -147,11 +156,6 @@ class TestPieceBase(unittest.TestCase):
         self.assertIn("(2,3)", piece_str)
 
 
-if __name__ == '__main__':
-    unittest.main()
-
-
-
 class TestStandardLandPieces(unittest.TestCase):
     """Test cases for standard land animal pieces."""
     
@@ -530,11 +534,6 @@ class TestRat(unittest.TestCase):
         self.assertFalse(rat.can_capture(cat, self.board))
 
 
-if __name__ == '__main__':
-    unittest.main()
-
-
-
 class TestLionAndTiger(unittest.TestCase):
     """Test cases for Lion and Tiger pieces with river jumping."""
     
@@ -81,6 +81,18 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(len(player.pieces), 0)
         self.assertNotIn(cat, player.pieces)
 
+    def test_clear_pieces(self):
+        """Test removing all pieces from a player."""
+        from model.piece import Cat, Dog
+
+        player = Player("Alice", PlayerColor.RED)
+        player.add_piece(Cat(player, Position(2, 0)))
+        player.add_piece(Dog(player, Position(2, 1)))
+
+        player.clear_pieces()
+        self.assertEqual(len(player.pieces), 0)
+        self.assertFalse(player.has_pieces())
+
     def test_remove_nonexistent_piece(self):
         """Test removing a piece that doesn't exist (should not raise error)."""
         from model.piece import Cat, Dog
@@ -112,15 +124,36 @@ class TestPlayer(unittest.TestCase):
         self.assertIn(cat, active_pieces)
         self.assertIn(dog, active_pieces)
 
-    def test_get_active_pieces_returns_list(self):
-        """Test that get_active_pieces returns a list."""
+    def test_get_active_pieces_returns_tuple(self):
+        """Test that get_active_pieces returns an immutable tuple."""
         player = Player("Bob", PlayerColor.BLUE)
 
         active_pieces = player.get_active_pieces()
 
-        self.assertIsInstance(active_pieces, list)
+        self.assertIsInstance(active_pieces, tuple)
         self.assertEqual(len(active_pieces), 0)
 
+    def test_get_active_pieces_refreshes_after_changes(self):
+        """Test that the cached active tuple follows adds and removes."""
+        from model.piece import Cat, Dog
+
+        player = Player("Alice", PlayerColor.RED)
+        cat = Cat(player, Position(2, 0))
+        dog = Dog(player, Position(2, 1))
+        player.add_piece(cat)
+
+        first = player.get_active_pieces()
+        self.assertIs(player.get_active_pieces(), first)
+
+        player.add_piece(dog)
+        self.assertCountEqual(player.get_active_pieces(), [cat, dog])
+
+        player.remove_piece(cat)
+        self.assertEqual(player.get_active_pieces(), (dog,))
+
+        player.clear_pieces()
+        self.assertEqual(player.get_active_pieces(), ())
+
     def test_has_pieces_with_pieces(self):
         """Test has_pieces returns True when player has pieces."""
         from model.piece import Cat
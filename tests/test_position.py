@@ -24,6 +24,14 @@ class TestPosition(unittest.TestCase):
         with self.assertRaises(AttributeError):
             pos.col = 10
     
+    def test_board_positions_are_interned(self):
+        """Test that on-board positions are shared and off-board ones still compare equal."""
+        import copy
+
+        self.assertIs(Position(8, 6), Position(8, 6))
+        self.assertIs(copy.deepcopy(Position(0, 0)), Position(0, 0))
+        self.assertEqual(Position(-1, 0), Position(-1, 0))
+
     def test_position_equality(self):
         """Test position equality comparison."""
         pos1 = Position(1, 2)